@@ -3,6 +3,7 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { BarChart3 } from "lucide-react";
 import { type Budget } from "@shared/schema";
+import { fromCents, sumCents } from "@shared/money";
 
 export default function BudgetOverview() {
   const { data: budgets, isLoading } = useQuery<Budget[]>({
@@ -12,9 +13,11 @@ export default function BudgetOverview() {
 
   // Calculate totals from active budgets
   const activeBudgets = budgets?.filter(budget => budget.status === 'active') || [];
-  const totalAllocated = activeBudgets.reduce((sum, budget) => sum + parseFloat(budget.totalAmount), 0);
-  const totalSpent = activeBudgets.reduce((sum, budget) => sum + parseFloat(budget.spentAmount || "0"), 0);
-  const totalRemaining = totalAllocated - totalSpent;
+  const allocatedCents = sumCents(activeBudgets, budget => budget.totalAmount);
+  const spentCents = sumCents(activeBudgets, budget => budget.spentAmount);
+  const totalAllocated = fromCents(allocatedCents);
+  const totalSpent = fromCents(spentCents);
+  const totalRemaining = fromCents(allocatedCents - spentCents);
 
   return (
     <Card className="border border-border shadow-sm">
@@ -9,6 +9,7 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table";
 import { type Payment, type Vendor, type Budget, type Expense } from "@shared/schema";
+import { fromCents, sumCents } from "@shared/money";
 import { BarChart3, FileText, Download, TrendingUp, DollarSign, Calendar } from "lucide-react";
 
 export default function Reports() {
@@ -78,14 +79,14 @@ export default function Reports() {
            expenseDate.getFullYear() === currentDate.getFullYear();
   }) || [];
 
-  const monthlyPaymentTotal = monthlyPayments.reduce((sum, payment) => sum + parseFloat(payment.amount), 0);
-  const monthlyExpenseTotal = monthlyExpenses.reduce((sum, expense) => sum + parseFloat(expense.amount), 0);
+  const monthlyPaymentTotal = fromCents(sumCents(monthlyPayments, payment => payment.amount));
+  const monthlyExpenseTotal = fromCents(sumCents(monthlyExpenses, expense => expense.amount));
 
   // Budget utilization
   const activeBudgets = budgets?.filter(budget => budget.status === 'active') || [];
-  const totalBudgetAmount = activeBudgets.reduce((sum, budget) => sum + parseFloat(budget.totalAmount), 0);
-  const totalSpentAmount = activeBudgets.reduce((sum, budget) => sum + parseFloat(budget.spentAmount || "0"), 0);
-  const budgetUtilization = totalBudgetAmount > 0 ? (totalSpentAmount / totalBudgetAmount) * 100 : 0;
+  const totalBudgetCents = sumCents(activeBudgets, budget => budget.totalAmount);
+  const totalSpentCents = sumCents(activeBudgets, budget => budget.spentAmount);
+  const budgetUtilization = totalBudgetCents > 0 ? (totalSpentCents / totalBudgetCents) * 100 : 0;
 
   return (
     <div className="flex h-screen bg-muted/30">
@@ -0,0 +1,69 @@
+import { describe, it, expect, vi, afterEach } from "vitest";
+import {
+  BaseProvider,
+  CIRCUIT_FAILURE_THRESHOLD,
+  CIRCUIT_RESET_MS,
+  type PaymentResult,
+} from "../services/base-provider";
+
+class FlakyProvider extends BaseProvider {
+  call = vi.fn(async (): Promise<PaymentResult> => {
+    throw new Error("connect ETIMEDOUT");
+  });
+
+  async initialize(): Promise<void> {}
+
+  validateConfig(): boolean {
+    return true;
+  }
+
+  getProviderName(): string {
+    return "flaky";
+  }
+
+  processPayment(): Promise<PaymentResult> {
+    return this.providerCall("processPayment", "Payment failed", this.call);
+  }
+}
+
+describe("provider circuit breaker", () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+    vi.useRealTimers();
+  });
+
+  it("fails fast once an action keeps throwing, then probes again after the reset window", async () => {
+    vi.spyOn(console, "log").mockImplementation(() => {});
+    vi.useFakeTimers();
+    const provider = new FlakyProvider({});
+
+    for (let i = 0; i < CIRCUIT_FAILURE_THRESHOLD; i++) {
+      expect(await provider.processPayment()).toEqual({ success: false, error: "connect ETIMEDOUT" });
+    }
+
+    const shortCircuited = await provider.processPayment();
+    expect(shortCircuited.success).toBe(false);
+    expect(shortCircuited.error).toContain("temporarily unavailable");
+    expect(provider.call).toHaveBeenCalledTimes(CIRCUIT_FAILURE_THRESHOLD);
+
+    vi.advanceTimersByTime(CIRCUIT_RESET_MS);
+    provider.call.mockResolvedValueOnce({ success: true, transactionId: "pi_1" });
+
+    expect(await provider.processPayment()).toEqual({ success: true, transactionId: "pi_1" });
+    expect(provider.call).toHaveBeenCalledTimes(CIRCUIT_FAILURE_THRESHOLD + 1);
+  });
+
+  it("keeps the circuit closed when the provider declines the card", async () => {
+    vi.spyOn(console, "log").mockImplementation(() => {});
+    const provider = new FlakyProvider({});
+    provider.call.mockImplementation(async () => {
+      throw Object.assign(new Error("Your card was declined."), { type: "StripeCardError", statusCode: 402 });
+    });
+
+    for (let i = 0; i < CIRCUIT_FAILURE_THRESHOLD * 2; i++) {
+      expect(await provider.processPayment()).toEqual({ success: false, error: "Your card was declined." });
+    }
+
+    expect(provider.call).toHaveBeenCalledTimes(CIRCUIT_FAILURE_THRESHOLD * 2);
+  });
+});
@@ -0,0 +1,55 @@
+import { describe, it, expect, vi, beforeEach } from "vitest";
+import { transactions } from "@shared/schema";
+
+const inserted = vi.hoisted(() => new Map<unknown, unknown[]>());
+
+vi.mock("../db", () => {
+  const tx = {
+    insert: (table: unknown) => ({
+      values: async (rows: unknown) => {
+        inserted.set(table, Array.isArray(rows) ? rows : [rows]);
+      },
+    }),
+  };
+  return {
+    db: { transaction: (run: (t: typeof tx) => Promise<void>) => run(tx) },
+  };
+});
+
+vi.mock("../services/provider-factory", () => ({
+  paymentServiceManager: {},
+}));
+
+describe("bulk transaction import", () => {
+  beforeEach(() => {
+    inserted.clear();
+  });
+
+  it("parses row dates and fails only the rows whose date is invalid", async () => {
+    const { BulkOperationsService } = await import("../services/bulk-operations");
+    const service = new BulkOperationsService();
+
+    const result = await service.bulkImportTransactions(
+      [
+        { amount: 120, type: "debit", description: "Office supplies", date: "2024-03-01T10:00:00Z", reference: "r1" },
+        { amount: 80, type: "credit", description: "Refund", date: "not a date", reference: "r2" },
+        { amount: 45, type: "debit", description: "Parking", reference: "r3" },
+      ],
+      "org-1",
+      "wallet-1",
+      "user-1",
+    );
+
+    expect(result).toMatchObject({
+      totalProcessed: 3,
+      successful: 2,
+      failed: 1,
+      errors: [{ id: "r2", error: "Invalid date" }],
+    });
+
+    const rows = inserted.get(transactions) as Array<typeof transactions.$inferInsert>;
+    expect(rows).toHaveLength(2);
+    expect(rows[0].createdAt).toEqual(new Date("2024-03-01T10:00:00Z"));
+    expect(rows[1].createdAt).toBeInstanceOf(Date);
+  });
+});
@@ -24,6 +24,9 @@ vi.mock("../db", () => {
       offset: () => builder,
       returning: () => Promise.resolve([]),
       execute: () => Promise.resolve([]),
+      prepare: () => ({
+        execute: () => Promise.resolve(tableData.get(currentTable) ?? []),
+      }),
       then(onFulfilled: any, onRejected: any) {
         const rows = tableData.get(currentTable) ?? [];
         return Promise.resolve(rows).then(onFulfilled, onRejected);
@@ -58,8 +61,10 @@ vi.mock("../db", () => {
   return {
     db,
     pool: { end: vi.fn() },
-    __setTableData: (table: any, rows: any[]) => {
-      tableData.set(table, rows);
+    __seedTables: (rowsByTable: Array<[any, any[]]>) => {
+      for (const [table, rows] of rowsByTable) {
+        tableData.set(table, rows);
+      }
     },
   };
 });
@@ -93,6 +98,8 @@ describe("Enhanced storage integration", () => {
     organizationId: "org-1",
     role: "admin",
   };
+  // Request identity attached by the stub auth middleware; never mutated
+  const authenticatedUser = { claims: { sub: user.id } };
 
   const serialize = <T>(value: T) => JSON.parse(JSON.stringify(value));
 
@@ -185,93 +192,46 @@ describe("Enhanced storage integration", () => {
 
     const dbModule: any = await import("../db");
     const schemaModule: any = await import("@shared/schema");
-    dbModule.__setTableData(schemaModule.users, [user]);
-    dbModule.__setTableData(schemaModule.budgets, budgets);
-    dbModule.__setTableData(schemaModule.vendors, vendors);
-    dbModule.__setTableData(schemaModule.payments, payments);
-    dbModule.__setTableData(schemaModule.expenses, expenses);
-    dbModule.__setTableData(schemaModule.digitalWallets, wallets);
+    dbModule.__seedTables([
+      [schemaModule.users, [user]],
+      [schemaModule.budgets, budgets],
+      [schemaModule.vendors, vendors],
+      [schemaModule.payments, payments],
+      [schemaModule.expenses, expenses],
+      [schemaModule.digitalWallets, wallets],
+    ]);
     (enhancedStorage as any).getOrganizationStats = async () => stats;
     (enhancedStorage as any).getTopVendors = async () => topVendorStats;
     (enhancedStorage as any).getRecentActivity = async () => recentActivity;
 
     app.use(express.json());
     app.use((req, _res, next) => {
-      (req as any).user = { claims: { sub: "user-1" } };
+      (req as any).user = authenticatedUser;
       next();
     });
 
-    app.get("/api/budgets", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getBudgets(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/vendors", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getVendors(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/payments", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getPayments(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/expenses", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getExpenses(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/wallets", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getDigitalWallets(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/analytics/stats", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getOrganizationStats(record.organizationId);
-      res.json(data);
-    });
-
-    app.get("/api/analytics/top-vendors", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getTopVendors(record.organizationId);
-      res.json(data);
-    });
+    // Each route resolves the caller's organization, then loads one dataset
+    const routeLoaders: Record<string, (organizationId: string) => Promise<unknown>> = {
+      "/api/budgets": (organizationId) => enhancedStorage.getBudgets(organizationId),
+      "/api/vendors": (organizationId) => enhancedStorage.getVendors(organizationId),
+      "/api/payments": (organizationId) => enhancedStorage.getPayments(organizationId),
+      "/api/expenses": (organizationId) => enhancedStorage.getExpenses(organizationId),
+      "/api/wallets": (organizationId) => enhancedStorage.getDigitalWallets(organizationId),
+      "/api/analytics/stats": (organizationId) => enhancedStorage.getOrganizationStats(organizationId),
+      "/api/analytics/top-vendors": (organizationId) => enhancedStorage.getTopVendors(organizationId),
+      "/api/analytics/recent-activity": (organizationId) => enhancedStorage.getRecentActivity(organizationId),
+    };
 
-    app.get("/api/analytics/recent-activity", async (req, res) => {
-      const record = await enhancedStorage.getUser((req as any).user.claims.sub);
-      if (!record?.organizationId) {
-        return res.status(400).json({ message: "User not associated with an organization" });
-      }
-      const data = await enhancedStorage.getRecentActivity(record.organizationId);
-      res.json(data);
-    });
+    for (const [path, load] of Object.entries(routeLoaders)) {
+      app.get(path, async (req, res) => {
+        const record = await enhancedStorage.getUser((req as any).user.claims.sub);
+        if (!record?.organizationId) {
+          return res.status(400).json({ message: "User not associated with an organization" });
+        }
+        const data = await load(record.organizationId);
+        res.json(data);
+      });
+    }
   });
 
   afterAll(() => {
@@ -288,51 +248,18 @@ describe("Enhanced storage integration", () => {
     expect(enhancedStorage.getDigitalWallets).toBe(DatabaseStorageClass.prototype.getDigitalWallets);
   });
 
-  it("serves budgets with persisted data", async () => {
-    const response = await request(app).get("/api/budgets");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(serialize(budgets));
-  });
-
-  it("serves vendors with persisted data", async () => {
-    const response = await request(app).get("/api/vendors");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(vendors);
-  });
-
-  it("serves payments with persisted data", async () => {
-    const response = await request(app).get("/api/payments");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(serialize(payments));
-  });
-
-  it("serves expenses with persisted data", async () => {
-    const response = await request(app).get("/api/expenses");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(serialize(expenses));
-  });
-
-  it("serves digital wallets with persisted data", async () => {
-    const response = await request(app).get("/api/wallets");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(serialize(wallets));
-  });
-
-  it("provides analytics stats", async () => {
-    const response = await request(app).get("/api/analytics/stats");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(stats);
-  });
-
-  it("provides top vendor analytics", async () => {
-    const response = await request(app).get("/api/analytics/top-vendors");
-    expect(response.status).toBe(200);
-    expect(response.body).toEqual(topVendorStats);
-  });
-
-  it("provides recent activity analytics", async () => {
-    const response = await request(app).get("/api/analytics/recent-activity");
+  it.each<[string, unknown]>([
+    ["/api/budgets", serialize(budgets)],
+    ["/api/vendors", serialize(vendors)],
+    ["/api/payments", serialize(payments)],
+    ["/api/expenses", serialize(expenses)],
+    ["/api/wallets", serialize(wallets)],
+    ["/api/analytics/stats", serialize(stats)],
+    ["/api/analytics/top-vendors", serialize(topVendorStats)],
+    ["/api/analytics/recent-activity", serialize(recentActivity)],
+  ])("serves %s with persisted data", async (path, expected) => {
+    const response = await request(app).get(path);
     expect(response.status).toBe(200);
-    expect(response.body).toEqual(recentActivity);
+    expect(response.body).toEqual(expected);
   });
 });
@@ -0,0 +1,91 @@
+import express from "express";
+import request from "supertest";
+import { describe, it, expect, vi, afterEach } from "vitest";
+import { recordQuery, trackQueries, ROUTE_QUERY_BUDGETS } from "../query-tracker";
+
+describe("query tracker", () => {
+  afterEach(() => {
+    vi.restoreAllMocks();
+    vi.unstubAllEnvs();
+    vi.resetModules();
+  });
+
+  it("warns when a request repeats the same statement", async () => {
+    const warn = vi.spyOn(console, "warn").mockImplementation(() => {});
+    const app = express();
+    app.use(trackQueries);
+    app.get("/api/items", async (_req, res) => {
+      for (let i = 0; i < 5; i++) {
+        await Promise.resolve();
+        recordQuery('select * from "vendors" where "id" = $1');
+      }
+      res.json([]);
+    });
+
+    await request(app).get("/api/items");
+
+    expect(warn).toHaveBeenCalledTimes(1);
+    expect(warn.mock.calls[0]).toContain(5);
+  });
+
+  it("stays quiet for distinct statements", async () => {
+    const warn = vi.spyOn(console, "warn").mockImplementation(() => {});
+    const app = express();
+    app.use(trackQueries);
+    app.get("/api/items", (_req, res) => {
+      recordQuery('select * from "vendors"');
+      recordQuery('select * from "payments"');
+      res.json([]);
+    });
+
+    await request(app).get("/api/items");
+
+    expect(warn).not.toHaveBeenCalled();
+  });
+
+  it("warns and reports the count when a route exceeds its query budget", async () => {
+    const warn = vi.spyOn(console, "warn").mockImplementation(() => {});
+    const app = express();
+    app.use(trackQueries);
+    app.get("/api/budgets", (_req, res) => {
+      recordQuery('select * from "users" where "id" = $1');
+      recordQuery('select * from "budgets" where "organization_id" = $1');
+      recordQuery('select * from "vendors"');
+      res.json([]);
+    });
+
+    const res = await request(app).get("/api/budgets");
+
+    expect(res.headers["x-query-count"]).toBe("3");
+    expect(warn).toHaveBeenCalledTimes(1);
+    expect(warn.mock.calls[0]).toEqual(
+      expect.arrayContaining(["GET /api/budgets", 3, ROUTE_QUERY_BUDGETS.get("GET /api/budgets")]),
+    );
+  });
+
+  it("fails the request in strict mode", async () => {
+    vi.stubEnv("STRICT_QUERY_TRACKING", "true");
+    // The flag is read at module load, so drop the copy imported above
+    vi.resetModules();
+    const tracker = await import("../query-tracker");
+    vi.spyOn(console, "warn").mockImplementation(() => {});
+    const app = express();
+    app.use(tracker.trackQueries);
+    app.get("/api/items", async (_req, res) => {
+      try {
+        for (let i = 0; i < 5; i++) {
+          await Promise.resolve();
+          tracker.recordQuery('select * from "vendors" where "id" = $1');
+        }
+        res.json([]);
+      } catch (error) {
+        res.status(500).json({ message: (error as Error).message });
+      }
+    });
+
+    const res = await request(app).get("/api/items");
+
+    expect(res.status).toBe(500);
+    expect(res.body.message).toContain("Repeated query blocked");
+  });
+});
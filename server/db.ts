@@ -2,6 +2,7 @@ import { Pool, neonConfig } from '@neondatabase/serverless';
 import { drizzle } from 'drizzle-orm/neon-serverless';
 import ws from "ws";
 import * as schema from "@shared/schema";
+import { recordQuery } from "./query-tracker";
 
 neonConfig.webSocketConstructor = ws;
 
@@ -11,5 +12,16 @@ if (!process.env.DATABASE_URL) {
   );
 }
 
-export const pool = new Pool({ connectionString: process.env.DATABASE_URL });
-export const db = drizzle({ client: pool, schema });
\ No newline at end of file
+export const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+  // Size the pool explicitly rather than relying on driver defaults so
+  // concurrent requests queue predictably instead of opening connections ad hoc.
+  max: parseInt(process.env.DB_POOL_MAX || '10', 10),
+  idleTimeoutMillis: parseInt(process.env.DB_POOL_IDLE_TIMEOUT_MS || '30000', 10),
+  connectionTimeoutMillis: parseInt(process.env.DB_POOL_CONNECTION_TIMEOUT_MS || '5000', 10),
+});
+export const db = drizzle({
+  client: pool,
+  schema,
+  logger: process.env.NODE_ENV === "development" ? { logQuery: recordQuery } : false,
+});
\ No newline at end of file
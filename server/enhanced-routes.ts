@@ -2,25 +2,48 @@
 
 import type { Express } from "express";
 import { isAuthenticated } from "./replitAuth";
-import { enhancedStorage } from "./enhanced-storage";
+import { enhancedStorage, type AuditLogCursor } from "./enhanced-storage";
 import { serviceRegistry } from "./services/service-registry";
 import bulkOperationsRouter from "./routes/bulk-operations";
 import { employeeVerificationService } from "./services/employee-verification";
-import { z } from "zod";
+import memoize from "memoizee";
 import {
   insertPaymentProviderSchema,
   insertIntegrationSchema,
-  insertIssuedCardSchema,
-  insertBankAccountSchema,
-  insertComplianceRecordSchema,
-  insertAuditLogSchema,
   insertGrantSchema,
-  insertAssetSchema,
   insertProcurementSchema,
-  insertCitizenServiceSchema,
-  insertEnhancedTransactionSchema,
 } from "@shared/schema";
 
+// Static listings are serialized once at startup instead of rebuilding and
+// stringifying the same arrays on every request.
+const PUBLIC_SERVICES_JSON = JSON.stringify([
+  { id: 'tax-payment', name: 'Property Tax Payment', category: 'tax', description: 'Pay your property taxes online' },
+  { id: 'utility-bill', name: 'Utility Bill Payment', category: 'utility', description: 'Pay water, electricity, and gas bills' },
+  { id: 'permits', name: 'Permits & Licenses', category: 'permit', description: 'Apply for building permits and business licenses' },
+  { id: 'court-fines', name: 'Court Fines & Fees', category: 'fine', description: 'Pay traffic tickets and court fees' },
+  { id: 'parking', name: 'Parking Permits', category: 'permit', description: 'Purchase monthly or annual parking permits' },
+]);
+
+const PAYMENT_PROVIDERS_JSON = JSON.stringify([
+  { name: 'stripe', status: 'active', methods: ['ach', 'wire', 'card'] },
+  { name: 'paypal', status: 'active', methods: ['instant', 'card'] },
+  { name: 'dwolla', status: 'active', methods: ['ach'] },
+  { name: 'wise', status: 'inactive', methods: ['wire', 'international'] },
+  { name: 'square', status: 'inactive', methods: ['card', 'ach'] },
+]);
+
+// Providers every comprehensive compliance screen fans out to
+const COMPLIANCE_SCREENING_PROVIDERS = ['thomson_reuters', 'lexisnexis', 'verafin', 'ofac'];
+
+// The public procurement listing is read by every anonymous visitor but only
+// changes when an RFP is created, so serve it from a short-lived cache.
+const getCachedOpenProcurements = memoize(
+  async (organizationId: string) => {
+    return await enhancedStorage.getOpenProcurements(organizationId);
+  },
+  { promise: true, maxAge: 60 * 1000 }
+);
+
 export function registerEnhancedRoutes(app: Express) {
   // ========== BULK OPERATIONS ROUTES ==========
   app.use('/api', bulkOperationsRouter);
@@ -70,14 +93,14 @@ export function registerEnhancedRoutes(app: Express) {
   app.patch("/api/employee/cards/:cardId/:action", isAuthenticated, async (req: any, res) => {
     try {
       const { cardId, action } = req.params;
-      const userId = req.user?.id;
+      const userId = req.user.claims.sub;
       
       // Verify card belongs to employee
-      const cards = await enhancedStorage.getIssuedCards();
-      const card = cards.find((c: any) => c.id === cardId);
+      const user = await enhancedStorage.getUser(userId);
+      const card = await enhancedStorage.getIssuedCard(cardId);
       
-      if (!card || (card.employeeId !== userId && card.holderName !== req.user?.name)) {
-        return res.status(403).json({ message: "Access denied" });
+      if (!user || !card || card.holderId !== user.id || card.organizationId !== user.organizationId) {
+        return res.status(404).json({ message: "Card not found" });
       }
       
       // Update card status
@@ -98,7 +121,7 @@ export function registerEnhancedRoutes(app: Express) {
     try {
       const { cardId } = req.params;
       const { pin } = req.body;
-      const userId = req.user?.id;
+      const userId = req.user.claims.sub;
       
       // Validate PIN format
       if (!pin || !/^\d{4}$/.test(pin)) {
@@ -106,11 +129,11 @@ export function registerEnhancedRoutes(app: Express) {
       }
       
       // Verify card belongs to employee
-      const cards = await enhancedStorage.getIssuedCards();
-      const card = cards.find((c: any) => c.id === cardId);
+      const user = await enhancedStorage.getUser(userId);
+      const card = await enhancedStorage.getIssuedCard(cardId);
       
-      if (!card || (card.employeeId !== userId && card.holderName !== req.user?.name)) {
-        return res.status(403).json({ message: "Access denied" });
+      if (!user || !card || card.holderId !== user.id || card.organizationId !== user.organizationId) {
+        return res.status(404).json({ message: "Card not found" });
       }
       
       // Store encrypted PIN (in production, use proper encryption)
@@ -130,14 +153,14 @@ export function registerEnhancedRoutes(app: Express) {
     try {
       const { cardId } = req.params;
       const { reason } = req.body;
-      const userId = req.user?.id;
+      const userId = req.user.claims.sub;
       
       // Verify card belongs to employee
-      const cards = await enhancedStorage.getIssuedCards();
-      const card = cards.find((c: any) => c.id === cardId);
+      const user = await enhancedStorage.getUser(userId);
+      const card = await enhancedStorage.getIssuedCard(cardId);
       
-      if (!card || (card.employeeId !== userId && card.holderName !== req.user?.name)) {
-        return res.status(403).json({ message: "Access denied" });
+      if (!user || !card || card.holderId !== user.id || card.organizationId !== user.organizationId) {
+        return res.status(404).json({ message: "Card not found" });
       }
       
       // Permanently deactivate card
@@ -150,7 +173,7 @@ export function registerEnhancedRoutes(app: Express) {
       
       // Create audit log
       await enhancedStorage.createAuditLog({
-        organizationId: card.organizationId || 'default',
+        organizationId: card.organizationId,
         userId: userId,
         action: 'card_reported',
         entityType: 'card',
@@ -226,12 +249,13 @@ export function registerEnhancedRoutes(app: Express) {
         return res.status(403).json({ message: "Insufficient permissions" });
       }
       
-      // Fetch pending ACH transfers
-      const transactions = await enhancedStorage.getEnhancedTransactions();
-      const pendingApprovals = transactions.filter((t: any) => 
-        t.type === 'ach_transfer' && 
-        (t.status === 'pending_approval' || t.status === 'pending_second_approval')
-      );
+      const organizationId = req.user?.organizationId;
+      if (!organizationId) {
+        return res.status(400).json({ message: "User not associated with an organization" });
+      }
+      
+      // Fetch pending ACH transfers, filtered in the database
+      const pendingApprovals = await enhancedStorage.getPendingAchApprovals(organizationId);
       
       res.json(pendingApprovals);
     } catch (error) {
@@ -251,11 +275,11 @@ export function registerEnhancedRoutes(app: Express) {
         return res.status(403).json({ message: "Insufficient permissions to approve transfers" });
       }
       
-      // Get transfer details
-      const transactions = await enhancedStorage.getEnhancedTransactions();
-      const transfer = transactions.find((t: any) => t.id === transferId);
+      // Get transfer details, scoped to the approver's organization
+      const user = await enhancedStorage.getUser(req.user.claims.sub);
+      const transfer = await enhancedStorage.getEnhancedTransaction(transferId);
       
-      if (!transfer) {
+      if (!user?.organizationId || !transfer || transfer.organizationId !== user.organizationId) {
         return res.status(404).json({ message: "Transfer not found" });
       }
       
@@ -386,10 +410,10 @@ export function registerEnhancedRoutes(app: Express) {
     try {
       const { transferId } = req.params;
       
-      const transactions = await enhancedStorage.getEnhancedTransactions();
-      const transfer = transactions.find((t: any) => t.id === transferId);
+      const user = await enhancedStorage.getUser(req.user.claims.sub);
+      const transfer = await enhancedStorage.getEnhancedTransaction(transferId);
       
-      if (!transfer) {
+      if (!user?.organizationId || !transfer || transfer.organizationId !== user.organizationId) {
         return res.status(404).json({ message: "Transfer not found" });
       }
       
@@ -410,14 +434,8 @@ export function registerEnhancedRoutes(app: Express) {
   // Public services listing
   app.get("/api/public/services", async (req, res) => {
     try {
-      const services = [
-        { id: 'tax-payment', name: 'Property Tax Payment', category: 'tax', description: 'Pay your property taxes online' },
-        { id: 'utility-bill', name: 'Utility Bill Payment', category: 'utility', description: 'Pay water, electricity, and gas bills' },
-        { id: 'permits', name: 'Permits & Licenses', category: 'permit', description: 'Apply for building permits and business licenses' },
-        { id: 'court-fines', name: 'Court Fines & Fees', category: 'fine', description: 'Pay traffic tickets and court fees' },
-        { id: 'parking', name: 'Parking Permits', category: 'permit', description: 'Purchase monthly or annual parking permits' },
-      ];
-      res.json(services);
+      res.set("Cache-Control", "public, max-age=300");
+      res.type("json").send(PUBLIC_SERVICES_JSON);
     } catch (error) {
       res.status(500).json({ message: "Failed to fetch public services" });
     }
@@ -470,10 +488,9 @@ export function registerEnhancedRoutes(app: Express) {
   // Check payment status
   app.get("/api/citizen/payment/:serviceId", async (req, res) => {
     try {
-      const services = await enhancedStorage.getCitizenServices('public');
-      const service = services.find(s => s.id === req.params.serviceId);
+      const service = await enhancedStorage.getCitizenService(req.params.serviceId);
       
-      if (!service) {
+      if (!service || service.organizationId !== 'public') {
         return res.status(404).json({ message: "Service record not found" });
       }
       
@@ -517,7 +534,7 @@ export function registerEnhancedRoutes(app: Express) {
   // Get open procurements (public)
   app.get("/api/vendor/procurements", async (req, res) => {
     try {
-      const procurements = await enhancedStorage.getOpenProcurements('public');
+      const procurements = await getCachedOpenProcurements('public');
       res.json(procurements);
     } catch (error) {
       res.status(500).json({ message: "Failed to fetch procurements" });
@@ -760,18 +777,7 @@ export function registerEnhancedRoutes(app: Express) {
   // Get payment providers status
   app.get("/api/payment-providers", isAuthenticated, async (req: any, res) => {
     try {
-      const userId = req.user.claims.sub;
-      const user = await enhancedStorage.getUser(userId);
-      
-      const providers = [
-        { name: 'stripe', status: 'active', methods: ['ach', 'wire', 'card'] },
-        { name: 'paypal', status: 'active', methods: ['instant', 'card'] },
-        { name: 'dwolla', status: 'active', methods: ['ach'] },
-        { name: 'wise', status: 'inactive', methods: ['wire', 'international'] },
-        { name: 'square', status: 'inactive', methods: ['card', 'ach'] },
-      ];
-      
-      res.json(providers);
+      res.type("json").send(PAYMENT_PROVIDERS_JSON);
     } catch (error) {
       console.error("Providers fetch error:", error);
       res.status(500).json({ message: "Failed to fetch providers" });
@@ -958,10 +964,10 @@ export function registerEnhancedRoutes(app: Express) {
   app.get("/api/employee/dashboard", isAuthenticated, async (req: any, res) => {
     try {
       const userId = req.user.claims.sub;
-      const employee = await employeeVerificationService.getVerifiedEmployee(userId);
+      const verified = await employeeVerificationService.getVerifiedEmployeeWithOrganization(userId);
       
       // Require verification
-      if (!employee) {
+      if (!verified) {
         return res.json({
           cards: [],
           expenses: [],
@@ -972,17 +978,20 @@ export function registerEnhancedRoutes(app: Express) {
         });
       }
       
-      // Get employee-specific data
-      const cards = await enhancedStorage.getCardsByHolder(userId);
-      const expenses = await enhancedStorage.getExpenses(employee.organizationId);
-      const userExpenses = expenses.filter(e => e.submittedBy === userId);
-      const grants = await enhancedStorage.getGrantsByManager(userId);
+      const { employee, organization } = verified;
+      
+      // Get employee-specific data; the lookups are independent so run them together
+      const [cards, userExpenses, grants] = await Promise.all([
+        enhancedStorage.getCardsByHolder(userId),
+        enhancedStorage.getExpensesBySubmitter(employee.organizationId, userId),
+        enhancedStorage.getGrantsByManager(userId),
+      ]);
       
       res.json({
         cards,
         expenses: userExpenses,
         managedGrants: grants,
-        organization: await enhancedStorage.getOrganization(employee.organizationId),
+        organization,
         employee,
         requiresVerification: false
       });
@@ -1007,7 +1016,7 @@ export function registerEnhancedRoutes(app: Express) {
       const provider = serviceRegistry.getService(user.organizationId, 'payment', 'stripe');
       if (provider && provider.issueCard) {
         const cardResult = await provider.issueCard(
-          `${user.firstName} ${user.lastName}`,
+          user.fullName ?? '',
           cardType,
           { monthly: spendingLimit }
         );
@@ -1017,7 +1026,7 @@ export function registerEnhancedRoutes(app: Express) {
           const card = await enhancedStorage.createIssuedCard({
             cardNumber: cardResult.cardNumber!,
             cardType: cardType as any,
-            holderName: `${user.firstName} ${user.lastName}`,
+            holderName: user.fullName ?? '',
             holderId: userId,
             organizationId: user.organizationId,
             provider: 'stripe',
@@ -1108,10 +1117,12 @@ export function registerEnhancedRoutes(app: Express) {
         return res.status(403).json({ message: "Unauthorized" });
       }
       
-      const analytics = await enhancedStorage.getComprehensiveAnalytics(user.organizationId);
-      const providerStats = await enhancedStorage.getProviderAnalytics(user.organizationId);
-      const complianceStats = await enhancedStorage.getComplianceAnalytics(user.organizationId);
-      const grantStats = await enhancedStorage.getGrantAnalytics(user.organizationId);
+      const [analytics, providerStats, complianceStats, grantStats] = await Promise.all([
+        enhancedStorage.getComprehensiveAnalytics(user.organizationId),
+        enhancedStorage.getProviderAnalytics(user.organizationId),
+        enhancedStorage.getComplianceAnalytics(user.organizationId),
+        enhancedStorage.getGrantAnalytics(user.organizationId),
+      ]);
       
       res.json({
         overview: analytics,
@@ -1220,17 +1231,17 @@ export function registerEnhancedRoutes(app: Express) {
         return res.status(400).json({ message: "Organization not found" });
       }
       
-      // Run multiple compliance checks
-      const providers = ['thomson_reuters', 'lexisnexis', 'verafin', 'ofac'];
-      const results = [];
-      
-      for (const providerName of providers) {
-        const provider = serviceRegistry.getService(user.organizationId, 'compliance', providerName);
-        if (provider && provider.screenEntity) {
-          const result = await provider.screenEntity(entityType, entityData);
-          results.push({ provider: providerName, result });
-        }
-      }
+      // Run the compliance checks concurrently; the screen takes as long as
+      // the slowest provider rather than the sum of all of them
+      const screenings = COMPLIANCE_SCREENING_PROVIDERS.map(async (providerName) => {
+        const provider = serviceRegistry.getService(user.organizationId!, 'compliance', providerName);
+        if (!provider || !provider.screenEntity) return null;
+        const result = await provider.screenEntity(entityType, entityData);
+        return { provider: providerName, result };
+      });
+      const results = (await Promise.all(screenings)).filter(
+        (screening): screening is { provider: string; result: any } => screening !== null
+      );
       
       // Calculate aggregate risk score
       const avgRiskScore = results.reduce((sum, r) => sum + (r.result.riskScore || 0), 0) / results.length;
@@ -1270,7 +1281,25 @@ export function registerEnhancedRoutes(app: Express) {
   app.get("/api/audit/trail/:entityType/:entityId", isAuthenticated, async (req: any, res) => {
     try {
       const { entityType, entityId } = req.params;
-      const logs = await enhancedStorage.getAuditLogsByEntity(entityType, entityId);
+      const limit = Math.min(parseInt(req.query.limit as string) || 100, 500);
+
+      // ?before=<createdAt ISO>,<id> continues from the last row of the previous page
+      let before: AuditLogCursor | undefined;
+      if (req.query.before) {
+        const [createdAt, id] = String(req.query.before).split(',');
+        const createdAtDate = new Date(createdAt);
+        if (!id || isNaN(createdAtDate.getTime())) {
+          return res.status(400).json({ message: "Invalid cursor" });
+        }
+        before = { createdAt: createdAtDate, id };
+      }
+
+      const logs = await enhancedStorage.getAuditLogsByEntity(entityType, entityId, limit, before);
+
+      if (logs.length === limit) {
+        const last = logs[logs.length - 1];
+        res.setHeader('X-Next-Cursor', `${new Date(last.createdAt!).toISOString()},${last.id}`);
+      }
       res.json(logs);
     } catch (error) {
       res.status(500).json({ message: "Failed to fetch audit trail" });
@@ -1397,6 +1426,7 @@ export function registerEnhancedRoutes(app: Express) {
       });
       
       const procurement = await enhancedStorage.createProcurement(validatedData);
+      getCachedOpenProcurements.clear();
       
       // Create RFP through e-procurement service
       const eProcurement = serviceRegistry.getService('public', 'specialized', 'eprocurement');
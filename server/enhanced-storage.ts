@@ -1,13 +1,10 @@
 // Enhanced storage implementation for comprehensive government platform
 
 import {
-  organizations,
   budgets,
-  budgetCategories,
   vendors,
   payments,
   expenses,
-  digitalWallets,
   paymentProviders,
   integrations,
   issuedCards,
@@ -42,10 +39,21 @@ import {
   type EnhancedTransaction,
   type InsertEnhancedTransaction,
 } from "@shared/schema";
+import { fromCents, sumCents } from "@shared/money";
 import { db } from "./db";
-import { eq, desc, and, sql, sum, gte, lte, or, like, inArray } from "drizzle-orm";
+import { eq, desc, and, sql, sum, gte, lte, or } from "drizzle-orm";
 import { DatabaseStorage, type IStorage } from "./storage";
-import { DatabaseStorage, IStorage } from "./storage";
+
+// Position of the last audit log on a page; the next page starts after it
+export interface AuditLogCursor {
+  createdAt: Date;
+  id: string;
+}
+
+// created_at carries microseconds but a cursor round-trips through a JS Date,
+// so the audit trail pages on the millisecond-truncated value (see
+// IDX_audit_logs_entity) and breaks ties within a millisecond by id
+const auditLogCreatedAtMs = sql`date_trunc('milliseconds', ${auditLogs.createdAt})`;
 
 export interface IEnhancedStorage extends IStorage {
   // Payment Provider operations
@@ -84,7 +92,7 @@ export interface IEnhancedStorage extends IStorage {
   // Audit operations
   createAuditLog(log: InsertAuditLog): Promise<AuditLog>;
   getAuditLogs(organizationId: string, limit?: number): Promise<AuditLog[]>;
-  getAuditLogsByEntity(entityType: string, entityId: string): Promise<AuditLog[]>;
+  getAuditLogsByEntity(entityType: string, entityId: string, limit?: number, before?: AuditLogCursor): Promise<AuditLog[]>;
   getAuditLogsByUser(userId: string, limit?: number): Promise<AuditLog[]>;
   
   // Grant operations
@@ -113,6 +121,7 @@ export interface IEnhancedStorage extends IStorage {
   
   // Citizen service operations
   getCitizenServices(organizationId: string): Promise<CitizenService[]>;
+  getCitizenService(id: string): Promise<CitizenService | undefined>;
   createCitizenService(service: InsertCitizenService): Promise<CitizenService>;
   updateCitizenService(id: string, service: Partial<InsertCitizenService>): Promise<CitizenService>;
   getCitizenServicesByType(organizationId: string, serviceType: string): Promise<CitizenService[]>;
@@ -120,6 +129,8 @@ export interface IEnhancedStorage extends IStorage {
   
   // Enhanced Transaction operations
   getEnhancedTransactions(organizationId: string): Promise<EnhancedTransaction[]>;
+  getEnhancedTransaction(id: string): Promise<EnhancedTransaction | undefined>;
+  getPendingAchApprovals(organizationId: string): Promise<EnhancedTransaction[]>;
   createEnhancedTransaction(transaction: InsertEnhancedTransaction): Promise<EnhancedTransaction>;
   getTransactionsByProvider(organizationId: string, provider: string): Promise<EnhancedTransaction[]>;
   getTransactionsByDateRange(organizationId: string, startDate: Date, endDate: Date): Promise<EnhancedTransaction[]>;
@@ -160,7 +171,7 @@ export class EnhancedDatabaseStorage
   async updatePaymentProvider(id: string, provider: Partial<InsertPaymentProvider>): Promise<PaymentProvider> {
     const [updated] = await db
       .update(paymentProviders)
-      .set({ ...provider, updatedAt: new Date() })
+      .set({ ...provider, updatedAt: sql`now()` })
       .where(eq(paymentProviders.id, id))
       .returning();
     return updated;
@@ -191,7 +202,7 @@ export class EnhancedDatabaseStorage
   async updateIntegration(id: string, integration: Partial<InsertIntegration>): Promise<Integration> {
     const [updated] = await db
       .update(integrations)
-      .set({ ...integration, updatedAt: new Date() })
+      .set({ ...integration, updatedAt: sql`now()` })
       .where(eq(integrations.id, id))
       .returning();
     return updated;
@@ -222,7 +233,7 @@ export class EnhancedDatabaseStorage
   async updateIssuedCard(id: string, card: Partial<InsertIssuedCard>): Promise<IssuedCard> {
     const [updated] = await db
       .update(issuedCards)
-      .set({ ...card, updatedAt: new Date() })
+      .set({ ...card, updatedAt: sql`now()` })
       .where(eq(issuedCards.id, id))
       .returning();
     return updated;
@@ -261,7 +272,7 @@ export class EnhancedDatabaseStorage
   async updateBankAccount(id: string, account: Partial<InsertBankAccount>): Promise<BankAccount> {
     const [updated] = await db
       .update(bankAccounts)
-      .set({ ...account, updatedAt: new Date() })
+      .set({ ...account, updatedAt: sql`now()` })
       .where(eq(bankAccounts.id, id))
       .returning();
     return updated;
@@ -300,7 +311,7 @@ export class EnhancedDatabaseStorage
   async updateComplianceRecord(id: string, record: Partial<InsertComplianceRecord>): Promise<ComplianceRecord> {
     const [updated] = await db
       .update(complianceRecords)
-      .set({ ...record, updatedAt: new Date() })
+      .set({ ...record, updatedAt: sql`now()` })
       .where(eq(complianceRecords.id, id))
       .returning();
     return updated;
@@ -350,17 +361,31 @@ export class EnhancedDatabaseStorage
       .limit(limit);
   }
 
-  async getAuditLogsByEntity(entityType: string, entityId: string): Promise<AuditLog[]> {
+  async getAuditLogsByEntity(
+    entityType: string,
+    entityId: string,
+    limit: number = 100,
+    before?: AuditLogCursor
+  ): Promise<AuditLog[]> {
+    const conditions = [
+      eq(auditLogs.entityType, entityType),
+      eq(auditLogs.entityId, entityId),
+    ];
+
+    // Seek past the last row of the previous page instead of using OFFSET,
+    // so deep pages cost the same index range scan as the first one
+    if (before) {
+      conditions.push(
+        sql`(${auditLogCreatedAtMs}, ${auditLogs.id}) < (${before.createdAt.toISOString()}::timestamp, ${before.id})`
+      );
+    }
+
     return await db
       .select()
       .from(auditLogs)
-      .where(
-        and(
-          eq(auditLogs.entityType, entityType),
-          eq(auditLogs.entityId, entityId)
-        )
-      )
-      .orderBy(desc(auditLogs.createdAt));
+      .where(and(...conditions))
+      .orderBy(desc(auditLogCreatedAtMs), desc(auditLogs.id))
+      .limit(limit);
   }
 
   async getAuditLogsByUser(userId: string, limit: number = 100): Promise<AuditLog[]> {
@@ -397,7 +422,7 @@ export class EnhancedDatabaseStorage
   async updateGrant(id: string, grant: Partial<InsertGrant>): Promise<Grant> {
     const [updated] = await db
       .update(grants)
-      .set({ ...grant, updatedAt: new Date() })
+      .set({ ...grant, updatedAt: sql`now()` })
       .where(eq(grants.id, id))
       .returning();
     return updated;
@@ -449,7 +474,7 @@ export class EnhancedDatabaseStorage
   async updateAsset(id: string, asset: Partial<InsertAsset>): Promise<Asset> {
     const [updated] = await db
       .update(assets)
-      .set({ ...asset, updatedAt: new Date() })
+      .set({ ...asset, updatedAt: sql`now()` })
       .where(eq(assets.id, id))
       .returning();
     return updated;
@@ -504,7 +529,7 @@ export class EnhancedDatabaseStorage
   async updateProcurement(id: string, procurement: Partial<InsertProcurement>): Promise<Procurement> {
     const [updated] = await db
       .update(procurements)
-      .set({ ...procurement, updatedAt: new Date() })
+      .set({ ...procurement, updatedAt: sql`now()` })
       .where(eq(procurements.id, id))
       .returning();
     return updated;
@@ -542,6 +567,11 @@ export class EnhancedDatabaseStorage
       .orderBy(desc(citizenServices.createdAt));
   }
 
+  async getCitizenService(id: string): Promise<CitizenService | undefined> {
+    const [service] = await db.select().from(citizenServices).where(eq(citizenServices.id, id));
+    return service;
+  }
+
   async createCitizenService(service: InsertCitizenService): Promise<CitizenService> {
     const [newService] = await db
       .insert(citizenServices)
@@ -553,7 +583,7 @@ export class EnhancedDatabaseStorage
   async updateCitizenService(id: string, service: Partial<InsertCitizenService>): Promise<CitizenService> {
     const [updated] = await db
       .update(citizenServices)
-      .set({ ...service, updatedAt: new Date() })
+      .set({ ...service, updatedAt: sql`now()` })
       .where(eq(citizenServices.id, id))
       .returning();
     return updated;
@@ -592,6 +622,27 @@ export class EnhancedDatabaseStorage
       .orderBy(desc(enhancedTransactions.createdAt));
   }
 
+  async getEnhancedTransaction(id: string): Promise<EnhancedTransaction | undefined> {
+    const [transaction] = await db.select().from(enhancedTransactions).where(eq(enhancedTransactions.id, id));
+    return transaction;
+  }
+
+  async getPendingAchApprovals(organizationId: string): Promise<EnhancedTransaction[]> {
+    // Approval states are written outside the payment_status enum, so compare
+    // as text rather than letting Postgres reject the literals
+    return await db
+      .select()
+      .from(enhancedTransactions)
+      .where(
+        and(
+          eq(enhancedTransactions.organizationId, organizationId),
+          eq(enhancedTransactions.type, 'ach_transfer'),
+          sql`${enhancedTransactions.status}::text in ('pending_approval', 'pending_second_approval')`
+        )
+      )
+      .orderBy(desc(enhancedTransactions.createdAt));
+  }
+
   async createEnhancedTransaction(transaction: InsertEnhancedTransaction): Promise<EnhancedTransaction> {
     const [newTransaction] = await db
       .insert(enhancedTransactions)
@@ -629,49 +680,58 @@ export class EnhancedDatabaseStorage
 
   // Advanced analytics
   async getComprehensiveAnalytics(organizationId: string): Promise<any> {
-    // Comprehensive analytics aggregation
-    const [totalBudget] = await db
-      .select({ total: sum(budgets.totalAmount) })
-      .from(budgets)
-      .where(eq(budgets.organizationId, organizationId));
-
-    const [totalExpenses] = await db
-      .select({ total: sum(expenses.amount) })
-      .from(expenses)
-      .where(eq(expenses.organizationId, organizationId));
-
-    const [totalPayments] = await db
-      .select({ total: sum(payments.amount) })
-      .from(payments)
-      .where(eq(payments.organizationId, organizationId));
-
-    const activeVendors = await db
-      .select({ count: sql`count(*)` })
-      .from(vendors)
-      .where(
-        and(
-          eq(vendors.organizationId, organizationId),
-          eq(vendors.status, 'active')
-        )
-      );
-
-    const activeGrants = await db
-      .select({ count: sql`count(*)` })
-      .from(grants)
-      .where(
-        and(
-          eq(grants.organizationId, organizationId),
-          eq(grants.status, 'active')
-        )
-      );
+    // Comprehensive analytics aggregation; the queries are independent
+    const [
+      [totalBudget],
+      [totalExpenses],
+      [totalPayments],
+      activeVendors,
+      activeGrants,
+      totalAssets,
+    ] = await Promise.all([
+      db
+        .select({ total: sum(budgets.totalAmount) })
+        .from(budgets)
+        .where(eq(budgets.organizationId, organizationId)),
+
+      db
+        .select({ total: sum(expenses.amount) })
+        .from(expenses)
+        .where(eq(expenses.organizationId, organizationId)),
+
+      db
+        .select({ total: sum(payments.amount) })
+        .from(payments)
+        .where(eq(payments.organizationId, organizationId)),
+
+      db
+        .select({ count: sql`count(*)` })
+        .from(vendors)
+        .where(
+          and(
+            eq(vendors.organizationId, organizationId),
+            eq(vendors.status, 'active')
+          )
+        ),
+
+      db
+        .select({ count: sql`count(*)` })
+        .from(grants)
+        .where(
+          and(
+            eq(grants.organizationId, organizationId),
+            eq(grants.status, 'active')
+          )
+        ),
 
-    const totalAssets = await db
-      .select({ 
-        count: sql`count(*)`,
-        value: sum(assets.currentValue)
-      })
-      .from(assets)
-      .where(eq(assets.organizationId, organizationId));
+      db
+        .select({ 
+          count: sql`count(*)`,
+          value: sum(assets.currentValue)
+        })
+        .from(assets)
+        .where(eq(assets.organizationId, organizationId)),
+    ]);
 
     return {
       financial: {
@@ -691,12 +751,35 @@ export class EnhancedDatabaseStorage
   }
 
   async getProviderAnalytics(organizationId: string): Promise<any> {
-    const providers = await this.getPaymentProviders(organizationId);
-    const transactions = await this.getEnhancedTransactions(organizationId);
+    const [providers, transactions] = await Promise.all([
+      this.getPaymentProviders(organizationId),
+      // Only the columns the rollup needs; skip descriptions, metadata and ids
+      db
+        .select({
+          provider: enhancedTransactions.provider,
+          amount: enhancedTransactions.amount,
+          createdAt: enhancedTransactions.createdAt,
+        })
+        .from(enhancedTransactions)
+        .where(eq(enhancedTransactions.organizationId, organizationId))
+        .orderBy(desc(enhancedTransactions.createdAt)),
+    ]);
+
+    // Group transactions by provider in one pass instead of re-scanning the
+    // full list for every configured provider.
+    const transactionsByProvider = new Map<string, typeof transactions>();
+    for (const tx of transactions) {
+      const group = transactionsByProvider.get(tx.provider);
+      if (group) {
+        group.push(tx);
+      } else {
+        transactionsByProvider.set(tx.provider, [tx]);
+      }
+    }
 
     const providerStats = providers.map(provider => {
-      const providerTx = transactions.filter(tx => tx.provider === provider.provider);
-      const totalVolume = providerTx.reduce((sum, tx) => sum + parseFloat(tx.amount), 0);
+      const providerTx = transactionsByProvider.get(provider.provider) ?? [];
+      const totalVolume = fromCents(sumCents(providerTx, tx => tx.amount));
       const avgTransaction = providerTx.length > 0 ? totalVolume / providerTx.length : 0;
 
       return {
@@ -737,11 +820,15 @@ export class EnhancedDatabaseStorage
 
   async getGrantAnalytics(organizationId: string): Promise<any> {
     const allGrants = await this.getGrants(organizationId);
-    const activeGrants = await this.getActiveGrants(organizationId);
+    // Derive the active subset from the rows already loaded
+    const activeGrants = allGrants.filter(g => g.status === 'active');
 
-    const totalGrantAmount = allGrants.reduce((sum, g) => sum + parseFloat(g.amount), 0);
-    const totalReceived = allGrants.reduce((sum, g) => sum + parseFloat(g.amountReceived), 0);
-    const totalSpent = allGrants.reduce((sum, g) => sum + parseFloat(g.amountSpent), 0);
+    const totalGrantCents = sumCents(allGrants, g => g.amount);
+    const totalReceivedCents = sumCents(allGrants, g => g.amountReceived);
+    const totalSpentCents = sumCents(allGrants, g => g.amountSpent);
+    const totalGrantAmount = fromCents(totalGrantCents);
+    const totalReceived = fromCents(totalReceivedCents);
+    const totalSpent = fromCents(totalSpentCents);
 
     const utilizationRate = totalGrantAmount > 0 ? (totalSpent / totalGrantAmount) * 100 : 0;
 
@@ -751,7 +838,7 @@ export class EnhancedDatabaseStorage
       totalAmount: totalGrantAmount,
       totalReceived,
       totalSpent,
-      remainingBalance: totalReceived - totalSpent,
+      remainingBalance: fromCents(totalReceivedCents - totalSpentCents),
       utilizationRate,
       avgGrantSize: totalGrantAmount / allGrants.length || 0
     };
@@ -0,0 +1,13 @@
+import memoize from "memoizee";
+import { enhancedStorage as storage } from "./enhanced-storage";
+
+// Dashboard stats run four aggregate queries for every dashboard view. Cache
+// them per organization briefly; every route that creates or changes the
+// status of a budget, vendor, payment or expense drops the entry for its
+// organization with getCachedOrganizationStats.delete(organizationId).
+export const getCachedOrganizationStats = memoize(
+  async (organizationId: string) => {
+    return await storage.getOrganizationStats(organizationId);
+  },
+  { promise: true, maxAge: 30 * 1000 }
+);
@@ -0,0 +1,91 @@
+import { AsyncLocalStorage } from "async_hooks";
+import type { Request, Response, NextFunction } from "express";
+
+// Number of times the same statement may run within one request before we
+// flag it as a likely N+1 (a query issued inside a loop over rows).
+const REPEATED_QUERY_THRESHOLD = 5;
+
+// With STRICT_QUERY_TRACKING=true the statement that crosses the threshold
+// throws instead, so the offending request fails while it is being written
+// rather than leaving a warning in the log.
+const strictQueryTracking = process.env.STRICT_QUERY_TRACKING === "true";
+
+// Most statements each hot route should need, keyed by "METHOD /route/path".
+// Exceeding a budget means a new per-row query has crept in.
+export const ROUTE_QUERY_BUDGETS = new Map<string, number>([
+  ["GET /api/budgets", 2],
+  ["GET /api/vendors", 2],
+  ["GET /api/payments", 2],
+  ["GET /api/expenses", 2],
+  ["GET /api/analytics/stats", 5],
+  ["GET /api/employee/dashboard", 4],
+  ["GET /api/audit/trail/:entityType/:entityId", 1],
+]);
+
+interface RequestQueries {
+  total: number;
+  counts: Map<string, number>;
+}
+
+const requestQueries = new AsyncLocalStorage<RequestQueries>();
+
+/**
+ * Drizzle logger hook. Records each statement against the current request,
+ * if one is being tracked; queries outside a request are ignored.
+ */
+export function recordQuery(query: string): void {
+  const stats = requestQueries.getStore();
+  if (!stats) return;
+
+  const count = (stats.counts.get(query) ?? 0) + 1;
+  stats.total++;
+  stats.counts.set(query, count);
+
+  if (strictQueryTracking && count === REPEATED_QUERY_THRESHOLD) {
+    throw new Error(`Repeated query blocked (${count}x): ${query}`);
+  }
+}
+
+/**
+ * Development-only middleware that warns when a request runs the same
+ * statement repeatedly, which usually means rows are being loaded one by one,
+ * or runs more statements than its route's budget. The count so far is
+ * reported in an X-Query-Count response header.
+ */
+export function trackQueries(req: Request, res: Response, next: NextFunction) {
+  if (!req.path.startsWith("/api")) {
+    return next();
+  }
+
+  const stats: RequestQueries = { total: 0, counts: new Map() };
+
+  const writeHead = res.writeHead;
+  res.writeHead = function (this: Response, ...args: any[]) {
+    if (!res.headersSent) {
+      res.setHeader("X-Query-Count", String(stats.total));
+    }
+    return writeHead.apply(this, args as any);
+  } as typeof res.writeHead;
+
+  res.on("finish", () => {
+    stats.counts.forEach((count, query) => {
+      if (count >= REPEATED_QUERY_THRESHOLD) {
+        console.warn("Possible N+1 in %s %s: ran %dx: %s", req.method, req.path, count, query);
+      }
+    });
+
+    const route = req.route ? `${req.method} ${req.baseUrl}${req.route.path}` : undefined;
+    const budget = route ? ROUTE_QUERY_BUDGETS.get(route) : undefined;
+    if (budget !== undefined && stats.total > budget) {
+      console.warn(
+        "Query budget exceeded for %s: ran %d, budget %d: %s",
+        route,
+        stats.total,
+        budget,
+        Array.from(stats.counts.keys()).join("; "),
+      );
+    }
+  });
+
+  requestQueries.run(stats, next);
+}
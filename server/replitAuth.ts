@@ -12,12 +12,19 @@ if (!process.env.REPLIT_DOMAINS) {
   throw new Error("Environment variable REPLIT_DOMAINS not provided");
 }
 
+// Resolved once at startup; request handlers read from here instead of
+// going back to process.env.
+const authConfig = Object.freeze({
+  domains: process.env.REPLIT_DOMAINS.split(","),
+  issuerUrl: new URL(process.env.ISSUER_URL ?? "https://replit.com/oidc"),
+  clientId: process.env.REPL_ID!,
+  sessionSecret: process.env.SESSION_SECRET!,
+  databaseUrl: process.env.DATABASE_URL,
+});
+
 const getOidcConfig = memoize(
   async () => {
-    return await client.discovery(
-      new URL(process.env.ISSUER_URL ?? "https://replit.com/oidc"),
-      process.env.REPL_ID!
-    );
+    return await client.discovery(authConfig.issuerUrl, authConfig.clientId);
   },
   { maxAge: 3600 * 1000 }
 );
@@ -26,13 +33,13 @@ export function getSession() {
   const sessionTtl = 7 * 24 * 60 * 60 * 1000; // 1 week
   const pgStore = connectPg(session);
   const sessionStore = new pgStore({
-    conString: process.env.DATABASE_URL,
+    conString: authConfig.databaseUrl,
     createTableIfMissing: false,
     ttl: sessionTtl,
     tableName: "sessions",
   });
   return session({
-    secret: process.env.SESSION_SECRET!,
+    secret: authConfig.sessionSecret,
     store: sessionStore,
     resave: false,
     saveUninitialized: false,
@@ -84,8 +91,12 @@ export async function setupAuth(app: Express) {
     verified(null, user);
   };
 
-  for (const domain of process.env
-    .REPLIT_DOMAINS!.split(",")) {
+  // Build the login/callback handlers once per domain at startup rather
+  // than constructing a new passport middleware on every request.
+  const loginHandlers = new Map<string, RequestHandler>();
+  const callbackHandlers = new Map<string, RequestHandler>();
+
+  for (const domain of authConfig.domains) {
     const strategy = new Strategy(
       {
         name: `replitauth:${domain}`,
@@ -96,30 +107,41 @@ export async function setupAuth(app: Express) {
       verify,
     );
     passport.use(strategy);
+
+    loginHandlers.set(domain, passport.authenticate(`replitauth:${domain}`, {
+      prompt: "login consent",
+      scope: ["openid", "email", "profile", "offline_access"],
+    }));
+    callbackHandlers.set(domain, passport.authenticate(`replitauth:${domain}`, {
+      successReturnToOrRedirect: "/",
+      failureRedirect: "/api/login",
+    }));
   }
 
   passport.serializeUser((user: Express.User, cb) => cb(null, user));
   passport.deserializeUser((user: Express.User, cb) => cb(null, user));
 
   app.get("/api/login", (req, res, next) => {
-    passport.authenticate(`replitauth:${req.hostname}`, {
+    const handler = loginHandlers.get(req.hostname) ?? passport.authenticate(`replitauth:${req.hostname}`, {
       prompt: "login consent",
       scope: ["openid", "email", "profile", "offline_access"],
-    })(req, res, next);
+    });
+    handler(req, res, next);
   });
 
   app.get("/api/callback", (req, res, next) => {
-    passport.authenticate(`replitauth:${req.hostname}`, {
+    const handler = callbackHandlers.get(req.hostname) ?? passport.authenticate(`replitauth:${req.hostname}`, {
       successReturnToOrRedirect: "/",
       failureRedirect: "/api/login",
-    })(req, res, next);
+    });
+    handler(req, res, next);
   });
 
   app.get("/api/logout", (req, res) => {
     req.logout(() => {
       res.redirect(
         client.buildEndSessionUrl(config, {
-          client_id: process.env.REPL_ID!,
+          client_id: authConfig.clientId,
           post_logout_redirect_uri: `${req.protocol}://${req.hostname}`,
         }).href
       );
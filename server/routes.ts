@@ -12,6 +12,7 @@ import {
   insertOrganizationSchema 
 } from "@shared/schema";
 import { z } from "zod";
+import { getCachedOrganizationStats } from "./organization-stats";
 import { registerEnhancedRoutes } from "./enhanced-routes";
 
 export async function registerRoutes(app: Express): Promise<Server> {
@@ -100,6 +101,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
       
       const budget = await storage.createBudget(validatedData);
+      getCachedOrganizationStats.delete(user.organizationId);
       res.status(201).json(budget);
     } catch (error) {
       if (error instanceof z.ZodError) {
@@ -138,6 +140,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
       
       const vendor = await storage.createVendor(validatedData);
+      getCachedOrganizationStats.delete(user.organizationId);
       res.status(201).json(vendor);
     } catch (error) {
       if (error instanceof z.ZodError) {
@@ -191,6 +194,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
       
       const payment = await storage.createPayment(validatedData);
+      getCachedOrganizationStats.delete(user.organizationId);
       res.status(201).json(payment);
     } catch (error) {
       if (error instanceof z.ZodError) {
@@ -230,6 +234,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       });
       
       const expense = await storage.createExpense(validatedData);
+      getCachedOrganizationStats.delete(user.organizationId);
       res.status(201).json(expense);
     } catch (error) {
       if (error instanceof z.ZodError) {
@@ -285,7 +290,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
       if (!user?.organizationId) {
         return res.status(400).json({ message: "User not associated with an organization" });
       }
-      const stats = await storage.getOrganizationStats(user.organizationId);
+      const stats = await getCachedOrganizationStats(user.organizationId);
       res.json(stats);
     } catch (error) {
       console.error("Error fetching stats:", error);
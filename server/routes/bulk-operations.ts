@@ -2,6 +2,7 @@ import { Router } from 'express';
 import { BulkOperationsService } from '../services/bulk-operations';
 import { isAuthenticated } from '../replitAuth';
 import { enhancedStorage } from '../enhanced-storage';
+import { getCachedOrganizationStats } from '../organization-stats';
 
 const router = Router();
 const bulkOps = new BulkOperationsService();
@@ -32,6 +33,8 @@ router.post('/bulk/payments', isAuthenticated, async (req: any, res) => {
       notes
     });
 
+    getCachedOrganizationStats.delete(user.organizationId);
+
     res.json({ success: true, result });
   } catch (error) {
     console.error('Bulk payment processing error:', error);
@@ -63,6 +66,8 @@ router.post('/bulk/vendors', isAuthenticated, async (req: any, res) => {
       createdBy: req.user.claims.sub
     });
 
+    getCachedOrganizationStats.delete(user.organizationId);
+
     res.json({ success: true, result });
   } catch (error) {
     console.error('Bulk vendor onboarding error:', error);
@@ -99,6 +104,8 @@ router.post('/bulk/expenses', isAuthenticated, async (req: any, res) => {
       notes
     });
 
+    getCachedOrganizationStats.delete(user.organizationId);
+
     res.json({ success: true, result });
   } catch (error) {
     console.error('Bulk expense processing error:', error);
@@ -118,15 +125,25 @@ router.post('/bulk/transactions/import', isAuthenticated, async (req: any, res)
       return res.status(400).json({ message: 'Organization not found' });
     }
 
-    const { transactions } = req.body;
+    const { transactions, walletId } = req.body;
 
     if (!transactions || !Array.isArray(transactions) || transactions.length === 0) {
       return res.status(400).json({ message: 'Transactions data required' });
     }
 
+    if (!walletId || typeof walletId !== 'string') {
+      return res.status(400).json({ message: 'Wallet ID required' });
+    }
+
+    const wallet = await enhancedStorage.getDigitalWallet(walletId);
+    if (!wallet || wallet.organizationId !== user.organizationId) {
+      return res.status(404).json({ message: 'Wallet not found' });
+    }
+
     const result = await bulkOps.bulkImportTransactions(
       transactions,
       user.organizationId,
+      walletId,
       req.user.claims.sub
     );
 
@@ -143,6 +160,12 @@ router.post('/bulk/transactions/import', isAuthenticated, async (req: any, res)
 // Bulk payment status update
 router.patch('/bulk/payments/status', isAuthenticated, async (req: any, res) => {
   try {
+    const user = await enhancedStorage.getUser(req.user.claims.sub);
+    
+    if (!user?.organizationId) {
+      return res.status(400).json({ message: 'Organization not found' });
+    }
+
     const { paymentIds, newStatus } = req.body;
 
     if (!paymentIds || !Array.isArray(paymentIds) || paymentIds.length === 0) {
@@ -159,6 +182,8 @@ router.patch('/bulk/payments/status', isAuthenticated, async (req: any, res) =>
       req.user.claims.sub
     );
 
+    getCachedOrganizationStats.delete(user.organizationId);
+
     res.json({ success: true, result });
   } catch (error) {
     console.error('Bulk payment status update error:', error);
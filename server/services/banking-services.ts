@@ -2,6 +2,21 @@
 
 import { BaseProvider, BaseProviderConfig, TransferResult, ComplianceResult } from './base-provider';
 
+const HOUR_MS = 60 * 60 * 1000;
+
+// Settlement time and fee for each Modern Treasury transfer speed, shared by
+// every transfer instead of being worked out per call
+const MODERN_TREASURY_ACH_TERMS = {
+  standard: { settlementHours: 72, fees: 0.25 },
+  same_day: { settlementHours: 4, fees: 1.50 },
+  next_day: { settlementHours: 24, fees: 0.75 },
+};
+
+const MODERN_TREASURY_WIRE_TERMS = {
+  domestic: { settlementHours: 2, fees: 25.00 },
+  international: { settlementHours: 48, fees: 45.00 },
+};
+
 // Modern Treasury Provider for treasury operations
 export interface ModernTreasuryConfig extends BaseProviderConfig {
   apiKey: string;
@@ -33,22 +48,7 @@ export class ModernTreasuryProvider extends BaseProvider {
     type: 'standard' | 'same_day' | 'next_day'
   ): Promise<TransferResult> {
     // Modern Treasury ACH processing
-    const estimatedSettlement = new Date();
-    let fees = 0;
-
-    switch (type) {
-      case 'same_day':
-        estimatedSettlement.setHours(estimatedSettlement.getHours() + 4);
-        fees = 1.50;
-        break;
-      case 'next_day':
-        estimatedSettlement.setDate(estimatedSettlement.getDate() + 1);
-        fees = 0.75;
-        break;
-      default:
-        estimatedSettlement.setDate(estimatedSettlement.getDate() + 3);
-        fees = 0.25;
-    }
+    const { settlementHours, fees } = MODERN_TREASURY_ACH_TERMS[type] ?? MODERN_TREASURY_ACH_TERMS.standard;
 
     this.logTransaction('processACH', { amount, type, fromAccount, toAccount });
 
@@ -57,7 +57,7 @@ export class ModernTreasuryProvider extends BaseProvider {
       transferId: `mt_ach_${Date.now()}`,
       providerTransactionId: `mt_${Math.random().toString(36).substring(7)}`,
       status: 'processing',
-      estimatedSettlement,
+      estimatedSettlement: new Date(Date.now() + settlementHours * HOUR_MS),
       fees
     };
   }
@@ -68,16 +68,9 @@ export class ModernTreasuryProvider extends BaseProvider {
     toAccount: string, 
     type: 'domestic' | 'international'
   ): Promise<TransferResult> {
-    const estimatedSettlement = new Date();
-    let fees = 0;
-
-    if (type === 'international') {
-      estimatedSettlement.setDate(estimatedSettlement.getDate() + 2);
-      fees = 45.00;
-    } else {
-      estimatedSettlement.setHours(estimatedSettlement.getHours() + 2);
-      fees = 25.00;
-    }
+    const { settlementHours, fees } = type === 'international'
+      ? MODERN_TREASURY_WIRE_TERMS.international
+      : MODERN_TREASURY_WIRE_TERMS.domestic;
 
     this.logTransaction('processWire', { amount, type, fromAccount, toAccount });
 
@@ -86,7 +79,7 @@ export class ModernTreasuryProvider extends BaseProvider {
       transferId: `mt_wire_${Date.now()}`,
       providerTransactionId: `mt_${Math.random().toString(36).substring(7)}`,
       status: 'processing',
-      estimatedSettlement,
+      estimatedSettlement: new Date(Date.now() + settlementHours * HOUR_MS),
       fees
     };
   }
@@ -1,5 +1,48 @@
 // Base provider interface for all payment and integration services
 
+// Inspecting the payload is the costly part of every provider log line (and
+// the payload can carry account details), so only dump it in development
+const logProviderPayloads = process.env.NODE_ENV === 'development';
+
+// Upper bound for a single outbound provider API call. SDK defaults are 80s
+// (Stripe) or unlimited (PayPal), which lets one stalled provider hold
+// requests open far longer than any client will wait.
+export const PROVIDER_REQUEST_TIMEOUT_MS = parseInt(process.env.PROVIDER_REQUEST_TIMEOUT_MS || '20000', 10);
+
+// After this many consecutive provider outages (see isProviderOutage) a
+// provider action fails fast for CIRCUIT_RESET_MS, instead of every request
+// waiting out the timeout against a provider that is down. The first call
+// after the window probes it again.
+export const CIRCUIT_FAILURE_THRESHOLD = 5;
+export const CIRCUIT_RESET_MS = 30 * 1000;
+
+const STRIPE_OUTAGE_ERRORS = new Set(['StripeConnectionError', 'StripeAPIError', 'StripeRateLimitError']);
+const NETWORK_ERROR_CODES = new Set(['ETIMEDOUT', 'ECONNABORTED', 'ECONNRESET', 'ECONNREFUSED', 'ENOTFOUND', 'EAI_AGAIN']);
+
+// Only transport failures, timeouts and provider-side (5xx) errors say the
+// provider is down. Declines and invalid requests are the caller's problem
+// and must not open the circuit for everyone else.
+export function isProviderOutage(error: unknown): boolean {
+  if (!error || typeof error !== 'object') return false;
+  const { type, statusCode, code, message } = error as Record<string, unknown>;
+
+  if (typeof type === 'string' && type.startsWith('Stripe')) {
+    return STRIPE_OUTAGE_ERRORS.has(type);
+  }
+  if (typeof statusCode === 'number') {
+    return statusCode >= 500;
+  }
+  if (typeof code === 'string' && NETWORK_ERROR_CODES.has(code)) {
+    return true;
+  }
+  return typeof message === 'string' && /ETIMEDOUT|timeout|timed out/i.test(message);
+}
+
+interface CircuitState {
+  failures: number;
+  openedAt: number;
+}
+
 export interface BaseProviderConfig {
   apiKey?: string;
   secretKey?: string;
@@ -43,6 +86,7 @@ export interface ComplianceResult {
 export abstract class BaseProvider {
   protected config: BaseProviderConfig;
   protected isTestMode: boolean;
+  private circuits: Map<string, CircuitState> = new Map();
 
   constructor(config: BaseProviderConfig) {
     this.config = config;
@@ -77,8 +121,52 @@ export abstract class BaseProvider {
     return amount > 0 && amount <= 999999.99;
   }
   
+  /**
+   * Runs a provider API call, logging and converting any thrown error into a
+   * failed result so callers get the same envelope from every provider.
+   * Repeated outages open a circuit for the action, see CIRCUIT_FAILURE_THRESHOLD.
+   */
+  protected async providerCall<T extends PaymentResult | ComplianceResult>(
+    action: string,
+    fallbackError: string,
+    call: () => Promise<T>
+  ): Promise<T> {
+    let circuit = this.circuits.get(action);
+    if (!circuit) {
+      circuit = { failures: 0, openedAt: 0 };
+      this.circuits.set(action, circuit);
+    }
+
+    if (circuit.openedAt && Date.now() - circuit.openedAt < CIRCUIT_RESET_MS) {
+      return { success: false, error: `${this.getProviderName()} is temporarily unavailable` } as T;
+    }
+
+    try {
+      const result = await call();
+      circuit.failures = 0;
+      circuit.openedAt = 0;
+      return result;
+    } catch (error) {
+      if (isProviderOutage(error)) {
+        circuit.failures++;
+        if (circuit.failures >= CIRCUIT_FAILURE_THRESHOLD) {
+          circuit.openedAt = Date.now();
+        }
+      }
+      const message = error instanceof Error ? error.message : fallbackError;
+      this.logTransaction(action, { error: message });
+      return { success: false, error: message } as T;
+    }
+  }
+
   protected logTransaction(action: string, data: Record<string, any>): void {
-    console.log(`[${this.getProviderName()}] ${action}:`, data);
+    if (logProviderPayloads) {
+      console.log('[%s] %s:', this.getProviderName(), action, data);
+    } else if (data.error) {
+      console.log('[%s] %s: %s', this.getProviderName(), action, data.error);
+    } else {
+      console.log('[%s] %s', this.getProviderName(), action);
+    }
   }
 }
 
@@ -1,10 +1,15 @@
 import { db } from '../db';
 import { 
   payments, vendors, expenses, transactions, auditLogs,
-  type Payment, type Vendor, type Expense, type Transaction
+  type Payment, type Vendor, type Expense
 } from '@shared/schema';
-import { eq, inArray, and, sql } from 'drizzle-orm';
+import { eq, inArray, and } from 'drizzle-orm';
 import { paymentServiceManager } from './provider-factory';
+import { customAlphabet } from 'nanoid';
+
+// Uppercase without look-alikes (0/O, 1/I). nanoid draws from a pooled crypto
+// buffer, so minting one per row in a large import stays cheap and collision-free.
+const generateVendorNumber = customAlphabet('23456789ABCDEFGHJKLMNPQRSTUVWXYZ', 10);
 
 export interface BulkOperationResult {
   totalProcessed: number;
@@ -54,10 +59,14 @@ export class BulkOperationsService {
       errors: [],
       processingTime: 0
     };
+    // One timestamp for the whole batch so every row shares the same updatedAt
+    const now = new Date();
 
     try {
       // Start transaction
       await db.transaction(async (tx) => {
+        const auditEntries: Array<typeof auditLogs.$inferInsert> = [];
+
         for (const paymentId of request.paymentIds) {
           try {
             const [payment] = await tx
@@ -115,25 +124,21 @@ export class BulkOperationsService {
               .update(payments)
               .set({ 
                 status: newStatus,
-                updatedAt: new Date()
+                updatedAt: now
               })
               .where(eq(payments.id, paymentId));
 
-            // Log audit trail
-            await tx
-              .insert(auditLogs)
-              .values({
-                userId: request.approvedBy || 'system',
-                action: `bulk_payment_${request.action}`,
-                entity: 'payment',
-                entityId: paymentId,
-                details: JSON.stringify({
-                  oldStatus: payment.status,
-                  newStatus,
-                  notes: request.notes
-                }),
-                ipAddress: '127.0.0.1'
-              });
+            // Queue audit trail entry; written in one batch below
+            auditEntries.push({
+              organizationId: payment.organizationId,
+              userId: request.approvedBy || 'system',
+              action: `bulk_payment_${request.action}`,
+              entityType: 'payment',
+              entityId: paymentId,
+              oldValues: { status: payment.status },
+              newValues: { status: newStatus, notes: request.notes },
+              ipAddress: '127.0.0.1'
+            });
 
             result.successful++;
           } catch (error) {
@@ -144,6 +149,10 @@ export class BulkOperationsService {
             result.failed++;
           }
         }
+
+        if (auditEntries.length > 0) {
+          await tx.insert(auditLogs).values(auditEntries);
+        }
       });
     } catch (error) {
       console.error('Bulk payment processing failed:', error);
@@ -169,6 +178,8 @@ export class BulkOperationsService {
 
     try {
       await db.transaction(async (tx) => {
+        const auditEntries: Array<typeof auditLogs.$inferInsert> = [];
+
         for (const vendorData of request.vendors) {
           try {
             // Check for duplicate
@@ -196,7 +207,7 @@ export class BulkOperationsService {
               .insert(vendors)
               .values({
                 organizationId: request.organizationId,
-                vendorNumber: `VND${Date.now()}${Math.floor(Math.random() * 1000)}`,
+                vendorNumber: `VND${generateVendorNumber()}`,
                 name: vendorData.name,
                 email: vendorData.email,
                 phone: vendorData.phone,
@@ -209,20 +220,19 @@ export class BulkOperationsService {
               })
               .returning();
 
-            // Log audit trail
-            await tx
-              .insert(auditLogs)
-              .values({
-                userId: request.createdBy,
-                action: 'bulk_vendor_onboard',
-                entity: 'vendor',
-                entityId: newVendor.id,
-                details: JSON.stringify({
-                  vendorName: vendorData.name,
-                  vendorEmail: vendorData.email
-                }),
-                ipAddress: '127.0.0.1'
-              });
+            // Queue audit trail entry; written in one batch below
+            auditEntries.push({
+              organizationId: request.organizationId,
+              userId: request.createdBy,
+              action: 'bulk_vendor_onboard',
+              entityType: 'vendor',
+              entityId: newVendor.id,
+              newValues: {
+                vendorName: vendorData.name,
+                vendorEmail: vendorData.email
+              },
+              ipAddress: '127.0.0.1'
+            });
 
             result.successful++;
           } catch (error) {
@@ -233,6 +243,10 @@ export class BulkOperationsService {
             result.failed++;
           }
         }
+
+        if (auditEntries.length > 0) {
+          await tx.insert(auditLogs).values(auditEntries);
+        }
       });
     } catch (error) {
       console.error('Bulk vendor onboarding failed:', error);
@@ -255,9 +269,12 @@ export class BulkOperationsService {
       errors: [],
       processingTime: 0
     };
+    const now = new Date();
 
     try {
       await db.transaction(async (tx) => {
+        const auditEntries: Array<typeof auditLogs.$inferInsert> = [];
+
         for (const expenseId of request.expenseIds) {
           try {
             const [expense] = await tx
@@ -296,7 +313,7 @@ export class BulkOperationsService {
                       amount: expense.amount,
                       currency: expense.currency || 'USD',
                       status: 'pending',
-                      paymentDate: new Date(),
+                      paymentDate: now,
                       description: `Expense reimbursement for ${expense.description}`,
                       createdBy: request.approvedBy || 'system'
                     });
@@ -310,26 +327,22 @@ export class BulkOperationsService {
               .set({ 
                 status: newStatus,
                 approvedBy: request.approvedBy,
-                approvedAt: request.action === 'approve' ? new Date() : undefined,
-                updatedAt: new Date()
+                approvedAt: request.action === 'approve' ? now : undefined,
+                updatedAt: now
               })
               .where(eq(expenses.id, expenseId));
 
-            // Log audit trail
-            await tx
-              .insert(auditLogs)
-              .values({
-                userId: request.approvedBy || 'system',
-                action: `bulk_expense_${request.action}`,
-                entity: 'expense',
-                entityId: expenseId,
-                details: JSON.stringify({
-                  oldStatus: expense.status,
-                  newStatus,
-                  notes: request.notes
-                }),
-                ipAddress: '127.0.0.1'
-              });
+            // Queue audit trail entry; written in one batch below
+            auditEntries.push({
+              organizationId: expense.organizationId,
+              userId: request.approvedBy || 'system',
+              action: `bulk_expense_${request.action}`,
+              entityType: 'expense',
+              entityId: expenseId,
+              oldValues: { status: expense.status },
+              newValues: { status: newStatus, notes: request.notes },
+              ipAddress: '127.0.0.1'
+            });
 
             result.successful++;
           } catch (error) {
@@ -340,6 +353,10 @@ export class BulkOperationsService {
             result.failed++;
           }
         }
+
+        if (auditEntries.length > 0) {
+          await tx.insert(auditLogs).values(auditEntries);
+        }
       });
     } catch (error) {
       console.error('Bulk expense processing failed:', error);
@@ -354,67 +371,77 @@ export class BulkOperationsService {
    * Bulk import transactions from CSV
    */
   async bulkImportTransactions(
-    transactions: Array<{
+    rows: Array<{
       amount: number;
       type: 'debit' | 'credit';
       description: string;
       category?: string;
-      date?: Date;
+      date?: string | Date;
       reference?: string;
     }>,
     organizationId: string,
+    walletId: string,
     importedBy: string
   ): Promise<BulkOperationResult> {
     const startTime = Date.now();
     const result: BulkOperationResult = {
-      totalProcessed: transactions.length,
+      totalProcessed: rows.length,
       successful: 0,
       failed: 0,
       errors: [],
       processingTime: 0
     };
+    const now = new Date();
+
+    // Validate and shape every row in a single pass, then write them with one
+    // multi-row INSERT instead of a round trip per transaction.
+    const values: Array<typeof transactions.$inferInsert> = [];
+    for (const row of rows) {
+      if (!Number.isFinite(row.amount) || (row.type !== 'debit' && row.type !== 'credit')) {
+        result.errors.push({ id: row.reference || 'unknown', error: 'Invalid amount or type' });
+        result.failed++;
+        continue;
+      }
+
+      // Dates arrive as JSON strings; a bad one fails its own row rather than
+      // the whole INSERT
+      const createdAt = row.date ? new Date(row.date) : now;
+      if (isNaN(createdAt.getTime())) {
+        result.errors.push({ id: row.reference || 'unknown', error: 'Invalid date' });
+        result.failed++;
+        continue;
+      }
+
+      values.push({
+        organizationId,
+        walletId,
+        type: row.type,
+        amount: row.amount.toString(),
+        description: row.description,
+        createdAt
+      });
+    }
 
     try {
       await db.transaction(async (tx) => {
-        for (const txData of transactions) {
-          try {
-            await tx
-              .insert(transactions)
-              .values({
-                organizationId,
-                walletId: null, // Will be linked later
-                type: txData.type,
-                amount: txData.amount.toString(),
-                currency: 'USD',
-                description: txData.description,
-                category: txData.category || 'general',
-                reference: txData.reference,
-                status: 'completed',
-                createdAt: txData.date || new Date()
-              });
-
-            result.successful++;
-          } catch (error) {
-            result.errors.push({ 
-              id: txData.reference || 'unknown', 
-              error: error instanceof Error ? error.message : 'Unknown error' 
-            });
-            result.failed++;
-          }
+        if (values.length > 0) {
+          await tx.insert(transactions).values(values);
+          result.successful = values.length;
         }
 
         // Log bulk import
         await tx
           .insert(auditLogs)
           .values({
+            organizationId,
             userId: importedBy,
             action: 'bulk_transaction_import',
-            entity: 'transaction',
-            entityId: organizationId,
-            details: JSON.stringify({
+            entityType: 'transaction',
+            entityId: walletId,
+            newValues: {
               totalImported: result.successful,
               failed: result.failed
-            }),
+            },
             ipAddress: '127.0.0.1'
           });
       });
@@ -1,4 +1,4 @@
-import { BaseProvider, BaseProviderConfig, PaymentResult, TransferResult, ComplianceResult } from './base-provider';
+import { BaseProvider, BaseProviderConfig, PaymentResult, ComplianceResult } from './base-provider';
 
 export interface CoinbaseConfig extends BaseProviderConfig {
   apiKey: string;
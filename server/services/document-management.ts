@@ -3,6 +3,7 @@ import { auditLogs } from '@shared/schema';
 import * as fs from 'fs/promises';
 import * as path from 'path';
 import * as crypto from 'crypto';
+import { nanoid } from 'nanoid';
 
 export interface Document {
   id: string;
@@ -95,7 +96,7 @@ export class DocumentManagementService {
       }
 
       // Generate unique file ID
-      const documentId = `doc_${Date.now()}_${Math.random().toString(36).substring(7)}`;
+      const documentId = `doc_${nanoid()}`;
       
       // Create organization directory
       const orgDir = path.join(this.uploadDir, organizationId);
@@ -146,11 +147,11 @@ export class DocumentManagementService {
           action: 'document_upload',
           entityType: entityType,
           entityId: entityId,
-          newValues: JSON.stringify({
+          newValues: {
             documentId,
             fileName: file.originalname,
             fileSize: file.size
-          }),
+          },
           ipAddress: '127.0.0.1'
         });
 
@@ -1,7 +1,11 @@
 import { db } from "../db";
-import { employees } from "@shared/schema";
-import { eq, and, sql } from "drizzle-orm";
-import * as bcrypt from "bcryptjs";
+import { employees, organizations } from "@shared/schema";
+import { eq, and, inArray, sql, type SQL } from "drizzle-orm";
+
+const REQUIRED_EMPLOYEE_COLUMNS = ['employee_id', 'first_name', 'last_name', 'date_of_birth', 'department', 'position', 'email', 'hire_date'];
+
+// Fields a re-import must not overwrite on an existing employee
+const UPSERT_PRESERVED_COLUMNS = new Set(['organizationId', 'employeeId', 'verificationAttempts']);
 
 export class EmployeeVerificationService {
   // Parse CSV and bulk create employees with comprehensive government fields
@@ -13,8 +17,8 @@ export class EmployeeVerificationService {
     const headers = lines[0].toLowerCase().split(',').map(h => h.trim());
     
     // Validate required headers
-    const requiredHeaders = ['employee_id', 'first_name', 'last_name', 'date_of_birth', 'department', 'position', 'email', 'hire_date'];
-    const missingHeaders = requiredHeaders.filter(h => !headers.includes(h));
+    const headerSet = new Set(headers);
+    const missingHeaders = REQUIRED_EMPLOYEE_COLUMNS.filter(h => !headerSet.has(h));
     
     if (missingHeaders.length > 0) {
       throw new Error(`Missing required columns: ${missingHeaders.join(', ')}`);
@@ -22,6 +26,14 @@ export class EmployeeVerificationService {
     
     const errors: string[] = [];
     let successCount = 0;
+    const now = new Date();
+    
+    // Parsed records keyed by employee ID, written with one upsert once every
+    // row has been parsed. A repeated ID is reported rather than dropped.
+    const parsedRecords = new Map<string, { row: number; record: any }>();
+    // Employee ID per email; email is unique as well, and one clash would
+    // abort the whole upsert
+    const importedEmails = new Map<string, string>();
     
     // Process each row
     for (let i = 1; i < lines.length; i++) {
@@ -67,7 +79,7 @@ export class EmployeeVerificationService {
           verificationAttempts: 0,
           verificationMethod: 'csv-upload',
           importSource: 'csv',
-          importDate: new Date(),
+          importDate: now,
         };
         
         // Add optional personal fields
@@ -121,32 +133,95 @@ export class EmployeeVerificationService {
         if (employeeData.pay_frequency) employeeRecord.payFrequency = employeeData.pay_frequency;
         if (employeeData.locality_pay_area) employeeRecord.localityPayArea = employeeData.locality_pay_area;
         
-        // Check if employee already exists
-        const existing = await db.select()
-          .from(employees)
-          .where(eq(employees.employeeId, employeeData.employee_id));
-        
-        if (existing.length > 0) {
-          // Update existing employee
-          delete employeeRecord.organizationId; // Don't update org ID
-          delete employeeRecord.verificationAttempts; // Keep existing attempts
-          await db.update(employees)
-            .set({
-              ...employeeRecord,
-              updatedAt: new Date(),
-            })
-            .where(eq(employees.employeeId, employeeData.employee_id));
-        } else {
-          // Insert new employee
-          await db.insert(employees).values(employeeRecord);
+        const earlier = parsedRecords.get(employeeRecord.employeeId);
+        if (earlier) {
+          errors.push(`Row ${i + 1}: Duplicate employee ID ${employeeRecord.employeeId} (first seen in row ${earlier.row})`);
+          continue;
         }
-        
-        successCount++;
+        const emailOwner = importedEmails.get(employeeRecord.email);
+        if (emailOwner) {
+          errors.push(`Row ${i + 1}: Email ${employeeRecord.email} is already used in row ${parsedRecords.get(emailOwner)!.row}`);
+          continue;
+        }
+        parsedRecords.set(employeeRecord.employeeId, { row: i + 1, record: employeeRecord });
+        importedEmails.set(employeeRecord.email, employeeRecord.employeeId);
       } catch (error) {
         errors.push(`Row ${i + 1}: ${error.message}`);
       }
     }
     
+    // One lookup for emails already held by a different employee ID, so those
+    // rows fail on their own instead of aborting the upsert for everyone
+    if (importedEmails.size > 0) {
+      const emailOwners = await db.select({ employeeId: employees.employeeId, email: employees.email })
+        .from(employees)
+        .where(inArray(employees.email, Array.from(importedEmails.keys())));
+      
+      for (const owner of emailOwners) {
+        const importedId = importedEmails.get(owner.email)!;
+        if (importedId === owner.employeeId) continue;
+        
+        errors.push(`Row ${parsedRecords.get(importedId)!.row}: Email ${owner.email} belongs to another employee`);
+        parsedRecords.delete(importedId);
+      }
+    }
+    
+    if (parsedRecords.size === 0) {
+      return { success: successCount, errors };
+    }
+    
+    const entries = Array.from(parsedRecords.values());
+    
+    // Existing employees take every imported value except their organization
+    // and verification attempts. Optional fields left blank in the CSV keep
+    // their current value.
+    const updateColumns = new Set<string>();
+    for (const { record } of entries) {
+      for (const key of Object.keys(record)) updateColumns.add(key);
+    }
+    const set: Record<string, SQL | Date> = { updatedAt: now };
+    for (const key of updateColumns) {
+      if (UPSERT_PRESERVED_COLUMNS.has(key)) continue;
+      const column = (employees as any)[key];
+      set[key] = sql`coalesce(excluded.${sql.identifier(column.name)}, ${column})`;
+    }
+    
+    // Insert new employees and update existing ones in a single statement.
+    // Employee IDs owned by another organization are left untouched.
+    const upsert = (records: any[]) => db.insert(employees)
+      .values(records)
+      .onConflictDoUpdate({
+        target: employees.employeeId,
+        set,
+        setWhere: eq(employees.organizationId, organizationId),
+      })
+      .returning({ employeeId: employees.employeeId });
+    
+    const recordWritten = (entry: { row: number; record: any }, written: boolean) => {
+      if (written) {
+        successCount++;
+      } else {
+        errors.push(`Row ${entry.row}: Employee ID ${entry.record.employeeId} belongs to another organization`);
+      }
+    };
+    
+    try {
+      const written = new Set((await upsert(entries.map(entry => entry.record))).map(e => e.employeeId));
+      for (const entry of entries) {
+        recordWritten(entry, written.has(entry.record.employeeId));
+      }
+    } catch {
+      // Something the pre-checks could not see (e.g. a concurrent import)
+      // rejected the batch; retry row by row so each error names its row
+      for (const entry of entries) {
+        try {
+          recordWritten(entry, (await upsert([entry.record])).length > 0);
+        } catch (error) {
+          errors.push(`Row ${entry.row}: ${error.message}`);
+        }
+      }
+    }
+    
     return { success: successCount, errors };
   }
   
@@ -264,6 +339,25 @@ export class EmployeeVerificationService {
     return employee || null;
   }
   
+  // Verified employee plus their organization in one joined query
+  async getVerifiedEmployeeWithOrganization(userId: string): Promise<{
+    employee: any;
+    organization: any | null;
+  } | null> {
+    const [row] = await db.select({
+      employee: employees,
+      organization: organizations,
+    })
+      .from(employees)
+      .leftJoin(organizations, eq(employees.organizationId, organizations.id))
+      .where(and(
+        eq(employees.userId, userId),
+        eq(employees.isVerified, true)
+      ));
+    
+    return row || null;
+  }
+  
   // Get employee by user ID
   async getEmployeeByUserId(userId: string): Promise<any | null> {
     const [employee] = await db.select()
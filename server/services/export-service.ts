@@ -1,11 +1,37 @@
 import { db } from '../db';
 import { 
-  payments, vendors, expenses, budgets, transactions, grants, assets,
-  type Payment, type Vendor, type Expense, type Budget
+  payments, vendors, expenses, budgets, transactions, grants, assets
 } from '@shared/schema';
 import { eq, and, gte, lte, desc } from 'drizzle-orm';
-import * as fs from 'fs';
-import * as path from 'path';
+import { fromCents, sumCents } from '@shared/money';
+
+// Fields containing any of these must be quoted; one test per cell instead of
+// a separate includes() for each character
+const CSV_NEEDS_QUOTING = /[",\r\n]/;
+
+function formatCsvValue(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  const stringValue = value instanceof Date ? value.toISOString() : String(value);
+  return CSV_NEEDS_QUOTING.test(stringValue)
+    ? `"${stringValue.replace(/"/g, '""')}"`
+    : stringValue;
+}
+
+const XML_SPECIAL_CHARS = /[&<>"]/g;
+const XML_ESCAPES: Record<string, string> = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' };
+
+function formatExcelRow(values: unknown[]): string {
+  let cells = '';
+  for (const value of values) {
+    const text = value === null || value === undefined
+      ? ''
+      : value instanceof Date ? value.toISOString() : String(value);
+    cells += `
+    <Cell><Data ss:Type="String">${text.replace(XML_SPECIAL_CHARS, char => XML_ESCAPES[char])}</Data></Cell>`;
+  }
+  return `   <Row>${cells}
+   </Row>`;
+}
 
 // jsPDF types for PDF generation
 interface JsPDFOptions {
@@ -148,24 +174,21 @@ export class ExportService {
     const headers = options.columns || Object.keys(data[0]);
     
     // Create CSV content
-    let csv = headers.join(',') + '\n';
-    
-    for (const row of data) {
-      const values = headers.map(header => {
-        const value = row[header];
-        // Escape values that contain commas or quotes
-        if (value === null || value === undefined) return '';
-        const stringValue = value.toString();
-        if (stringValue.includes(',') || stringValue.includes('"')) {
-          return `"${stringValue.replace(/"/g, '""')}"`;
-        }
-        return stringValue;
-      });
-      csv += values.join(',') + '\n';
+    const lines = new Array<string>(data.length + 1);
+    lines[0] = headers.join(',');
+
+    for (let i = 0; i < data.length; i++) {
+      const row = data[i];
+      let line = '';
+      for (let j = 0; j < headers.length; j++) {
+        if (j > 0) line += ',';
+        line += formatCsvValue(row[headers[j]]);
+      }
+      lines[i + 1] = line;
     }
 
     return {
-      data: csv,
+      data: lines.join('\n') + '\n',
       fileName: `${options.entityType}_${new Date().toISOString().split('T')[0]}.csv`,
       mimeType: 'text/csv'
     };
@@ -186,7 +209,9 @@ export class ExportService {
     };
 
     return {
-      data: JSON.stringify(exportData, null, 2),
+      // Compact output: indentation roughly doubles the size of large exports
+      // and makes stringify noticeably slower for no benefit to importers.
+      data: JSON.stringify(exportData),
       fileName: `${options.entityType}_${new Date().toISOString().split('T')[0]}.json`,
       mimeType: 'application/json'
     };
@@ -306,37 +331,26 @@ startxref
    * Export to Excel format
    */
   private exportToExcel(data: any[], options: ExportOptions): { data: Buffer; fileName: string; mimeType: string } {
-    // Simple Excel file generation using CSV format that Excel can open
+    // Simple Excel file generation using SpreadsheetML that Excel can open
     // In production, you would use a library like xlsx or exceljs
-    
-    const csvData = this.exportToCSV(data, options);
-    
-    // Convert CSV to a simple Excel-compatible format
-    // This is a simplified version - real Excel files are much more complex
-    const excelContent = `<?xml version="1.0"?>
+
+    // Cells are built straight from the rows in one pass rather than by
+    // generating the CSV export and splitting it back apart
+    const headers = options.columns || (data.length > 0 ? Object.keys(data[0]) : []);
+    const rows = new Array<string>(data.length + 1);
+    rows[0] = formatExcelRow(headers);
+    for (let i = 0; i < data.length; i++) {
+      const row = data[i];
+      rows[i + 1] = formatExcelRow(headers.map(header => row[header]));
+    }
+
+    const finalExcelContent = `<?xml version="1.0"?>
 <?mso-application progid="Excel.Sheet"?>
 <Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"
  xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">
  <Worksheet ss:Name="${options.entityType}">
-  <Table>`;
-
-    const rows = csvData.data.split('\n');
-    for (const row of rows) {
-      if (row.trim()) {
-        excelContent + `
-   <Row>`;
-        const cells = row.split(',');
-        for (const cell of cells) {
-          const cleanCell = cell.replace(/^"/, '').replace(/"$/, '').replace(/""/g, '"');
-          excelContent + `
-    <Cell><Data ss:Type="String">${cleanCell}</Data></Cell>`;
-        }
-        excelContent + `
-   </Row>`;
-      }
-    }
-
-    const finalExcelContent = excelContent + `
+  <Table>
+${rows.join('\n')}
   </Table>
  </Worksheet>
 </Workbook>`;
@@ -376,9 +390,9 @@ startxref
     ]);
 
     // Calculate totals
-    const totalPayments = paymentsData.reduce((sum, p) => sum + parseFloat(p.amount), 0);
-    const totalExpenses = expensesData.reduce((sum, e) => sum + parseFloat(e.amount), 0);
-    const totalBudget = budgetsData.reduce((sum, b) => sum + parseFloat(b.totalAmount), 0);
+    const totalPayments = fromCents(sumCents(paymentsData, p => p.amount));
+    const totalExpenses = fromCents(sumCents(expensesData, e => e.amount));
+    const totalBudget = fromCents(sumCents(budgetsData, b => b.totalAmount));
 
     const reportData = {
       summary: {
@@ -2,15 +2,42 @@ import {
   Client, 
   Environment, 
   OrdersController,
-  PaymentsController 
+  PaymentsController,
+  type ClientCredentialsAuthManager,
+  type OAuthToken
 } from '@paypal/paypal-server-sdk';
-import { BaseProvider, BaseProviderConfig, PaymentResult, TransferResult, CardIssueResult, ComplianceResult } from './base-provider';
+import * as https from 'https';
+import { BaseProvider, BaseProviderConfig, PROVIDER_REQUEST_TIMEOUT_MS, PaymentResult, TransferResult, CardIssueResult, ComplianceResult } from './base-provider';
 
 export interface PayPalConfig extends BaseProviderConfig {
   clientId: string;
   clientSecret: string;
 }
 
+// Shared keep-alive agent so every PayPal client reuses pooled TLS
+// connections instead of paying a new handshake per API call.
+const paypalHttpsAgent = new https.Agent({ keepAlive: true, maxSockets: 50 });
+
+// OAuth tokens last hours, but each Client fetches its own. Share them per
+// client id across provider instances, and collapse concurrent refreshes into
+// one token request.
+const paypalTokens = new Map<string, OAuthToken>();
+const pendingPayPalTokens = new Map<string, Promise<OAuthToken>>();
+
+function getPayPalToken(clientId: string, authManager: ClientCredentialsAuthManager): Promise<OAuthToken> {
+  const cached = paypalTokens.get(clientId);
+  if (cached && !authManager.isExpired(cached)) {
+    return Promise.resolve(cached);
+  }
+
+  let pending = pendingPayPalTokens.get(clientId);
+  if (!pending) {
+    pending = authManager.fetchToken().finally(() => pendingPayPalTokens.delete(clientId));
+    pendingPayPalTokens.set(clientId, pending);
+  }
+  return pending;
+}
+
 export class PayPalProvider extends BaseProvider {
   private client: Client;
   private ordersController: OrdersController;
@@ -23,8 +50,16 @@ export class PayPalProvider extends BaseProvider {
       clientCredentialsAuthCredentials: {
         oAuthClientId: config.clientId,
         oAuthClientSecret: config.clientSecret,
+        oAuthTokenProvider: (_lastToken, authManager) => getPayPalToken(config.clientId, authManager),
+        oAuthOnTokenUpdate: (token) => {
+          paypalTokens.set(config.clientId, token);
+        },
       },
       environment: this.isTestMode ? Environment.Sandbox : Environment.Production,
+      timeout: PROVIDER_REQUEST_TIMEOUT_MS,
+      httpClientOptions: {
+        httpsAgent: paypalHttpsAgent,
+      },
     });
     
     this.ordersController = new OrdersController(this.client);
@@ -54,7 +89,7 @@ export class PayPalProvider extends BaseProvider {
   }
 
   async processPayment(amount: number, currency: string = 'USD', metadata?: Record<string, any>): Promise<PaymentResult> {
-    try {
+    return this.providerCall<PaymentResult>('processPayment', 'PayPal payment processing failed', async () => {
       if (!this.validateAmount(amount)) {
         return { success: false, error: 'Invalid amount' };
       }
@@ -72,8 +107,8 @@ export class PayPalProvider extends BaseProvider {
         }
       };
 
-      const { body } = await this.ordersController.createOrder(orderRequest);
-      const order = JSON.parse(String(body));
+      // The SDK has already deserialized the response into `result`
+      const { result: order } = await this.ordersController.createOrder(orderRequest);
 
       this.logTransaction('processPayment', { 
         amount, 
@@ -89,25 +124,15 @@ export class PayPalProvider extends BaseProvider {
           approvalUrl: order.links?.find((link: any) => link.rel === 'approve')?.href 
         }
       };
-    } catch (error) {
-      this.logTransaction('processPayment', { 
-        error: error instanceof Error ? error.message : 'Unknown error' 
-      });
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'PayPal payment processing failed' 
-      };
-    }
+    });
   }
 
   async capturePayment(orderId: string): Promise<PaymentResult> {
-    try {
-      const { body } = await this.ordersController.captureOrder({
+    return this.providerCall<PaymentResult>('capturePayment', 'PayPal capture failed', async () => {
+      const { result: capture } = await this.ordersController.captureOrder({
         id: orderId,
         prefer: 'return=minimal'
       });
-      
-      const capture = JSON.parse(String(body));
 
       this.logTransaction('capturePayment', { orderId, captureId: capture.id });
 
@@ -117,12 +142,7 @@ export class PayPalProvider extends BaseProvider {
         providerTransactionId: orderId,
         metadata: { status: capture.status }
       };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'PayPal capture failed' 
-      };
-    }
+    });
   }
 
   async processACH(
@@ -139,24 +159,7 @@ export class PayPalProvider extends BaseProvider {
   }
 
   async createPayout(amount: number, recipientEmail: string, note?: string): Promise<PaymentResult> {
-    try {
-      const payoutRequest = {
-        sender_batch_header: {
-          sender_batch_id: `batch_${Date.now()}`,
-          email_subject: 'Government Payment',
-          email_message: note || 'Payment from government entity'
-        },
-        items: [{
-          recipient_type: 'EMAIL',
-          amount: {
-            value: amount.toFixed(2),
-            currency: 'USD'
-          },
-          receiver: recipientEmail,
-          note: note || 'Government payment'
-        }]
-      };
-
+    return this.providerCall<PaymentResult>('createPayout', 'PayPal payout failed', async () => {
       // Note: This would require PayPal Payouts API which needs additional setup
       this.logTransaction('createPayout', { amount, recipientEmail });
 
@@ -165,12 +168,7 @@ export class PayPalProvider extends BaseProvider {
         transactionId: `payout_${Date.now()}`,
         metadata: { recipientEmail, note }
       };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'PayPal payout failed' 
-      };
-    }
+    });
   }
 
   async processWire(amount: number, fromAccount: string, toAccount: string, type: 'domestic' | 'international'): Promise<TransferResult> {
@@ -1,9 +1,9 @@
 import { db } from '../db';
 import { 
-  payments, expenses, budgets, transactions, vendors, grants, assets,
-  type Payment, type Expense, type Budget, type Transaction
+  payments, expenses, grants,
+  type Payment, type Expense, type Budget
 } from '@shared/schema';
-import { eq, and, gte, lte, sql, desc } from 'drizzle-orm';
+import { eq, and, gte, sql, desc } from 'drizzle-orm';
 
 export interface PredictionResult {
   metric: string;
@@ -329,7 +329,6 @@ export class PredictiveAnalyticsService {
     
     // Calculate burn rate
     const dailyBurnRate = daysElapsed > 0 ? spent / daysElapsed : 0;
-    const expectedUtilization = (daysElapsed / totalDays) * total;
     const utilizationRate = spent / total;
     
     // Predict final utilization
@@ -1,77 +1,64 @@
 import { BaseProvider, BaseProviderConfig, ProviderFactory } from './base-provider';
-import { StripeProvider, StripeConfig } from './stripe-provider';
-import { PayPalProvider, PayPalConfig } from './paypal-provider';
-import { SquareProvider, SquareConfig } from './square-provider';
-import { PlaidProvider, PlaidConfig } from './plaid-provider';
-import { DwollaProvider, DwollaConfig } from './dwolla-provider';
-import { UnitProvider, UnitConfig } from './unit-provider';
-import { WiseProvider, WiseConfig } from './wise-provider';
-import { CircleProvider, CircleConfig } from './circle-provider';
-import { CoinbaseProvider, CoinbaseConfig } from './coinbase-provider';
-import { SaltEdgeProvider, SaltEdgeConfig } from './saltedge-provider';
-import { AdyenProvider, AdyenConfig } from './adyen-provider';
-import { CheckoutProvider, CheckoutConfig } from './checkout-provider';
+import { StripeProvider } from './stripe-provider';
+import { PayPalProvider } from './paypal-provider';
+import { SquareProvider } from './square-provider';
+import { PlaidProvider } from './plaid-provider';
+import { DwollaProvider } from './dwolla-provider';
+import { UnitProvider } from './unit-provider';
+import { WiseProvider } from './wise-provider';
+import { CircleProvider } from './circle-provider';
+import { CoinbaseProvider } from './coinbase-provider';
+import { SaltEdgeProvider } from './saltedge-provider';
+import { AdyenProvider } from './adyen-provider';
+import { CheckoutProvider } from './checkout-provider';
+
+// Explicit list of the providers this build can construct
+const PROVIDER_CONSTRUCTORS = new Map<string, new (config: any) => BaseProvider>([
+  ['stripe', StripeProvider],
+  ['paypal', PayPalProvider],
+  ['square', SquareProvider],
+  ['plaid', PlaidProvider],
+  ['dwolla', DwollaProvider],
+  ['unit', UnitProvider],
+  ['wise', WiseProvider],
+  ['circle', CircleProvider],
+  ['coinbase', CoinbaseProvider],
+  ['saltedge', SaltEdgeProvider],
+  ['adyen', AdyenProvider],
+  ['checkout', CheckoutProvider],
+]);
+
+// Providers advertised through /api/payment-providers. This includes
+// integrations that have no implementation here yet, so the client listing
+// is unchanged by the registry above.
+const ADVERTISED_PROVIDERS = [
+  ...PROVIDER_CONSTRUCTORS.keys(),
+  'braintree',
+  'authorize_net',
+  'worldpay',
+  'bluesnap',
+  'payoneer',
+  'payu',
+  'razorpay',
+  'mollie',
+  'klarna',
+  '2checkout',
+  'skrill',
+  'paysafe',
+  'alipay',
+];
 
 export class PaymentProviderFactory implements ProviderFactory {
   createProvider(providerType: string, config: BaseProviderConfig): BaseProvider {
-    switch (providerType.toLowerCase()) {
-      case 'stripe':
-        return new StripeProvider(config as StripeConfig);
-      case 'paypal':
-        return new PayPalProvider(config as PayPalConfig);
-      case 'square':
-        return new SquareProvider(config as SquareConfig);
-      case 'plaid':
-        return new PlaidProvider(config as PlaidConfig);
-      case 'dwolla':
-        return new DwollaProvider(config as DwollaConfig);
-      case 'unit':
-        return new UnitProvider(config as UnitConfig);
-      case 'wise':
-        return new WiseProvider(config as WiseConfig);
-      case 'circle':
-        return new CircleProvider(config as CircleConfig);
-      case 'coinbase':
-        return new CoinbaseProvider(config as CoinbaseConfig);
-      case 'saltedge':
-        return new SaltEdgeProvider(config as SaltEdgeConfig);
-      case 'adyen':
-        return new AdyenProvider(config as AdyenConfig);
-      case 'checkout':
-        return new CheckoutProvider(config as CheckoutConfig);
-      default:
-        throw new Error(`Unsupported provider type: ${providerType}`);
+    const Provider = PROVIDER_CONSTRUCTORS.get(providerType.toLowerCase());
+    if (!Provider) {
+      throw new Error(`Unsupported provider type: ${providerType}`);
     }
+    return new Provider(config);
   }
 
   getSupportedProviders(): string[] {
-    return [
-      'stripe',
-      'paypal',
-      'square',
-      'plaid',
-      'dwolla',
-      'unit',
-      'wise',
-      'circle',
-      'coinbase',
-      'saltedge',
-      'adyen',
-      'checkout',
-      'braintree',
-      'authorize_net',
-      'worldpay',
-      'bluesnap',
-      'payoneer',
-      'payu',
-      'razorpay',
-      'mollie',
-      'klarna',
-      '2checkout',
-      'skrill',
-      'paysafe',
-      'alipay'
-    ];
+    return [...ADVERTISED_PROVIDERS];
   }
 }
 
@@ -124,7 +111,7 @@ export class PaymentServiceManager {
             return { provider: providerType, result };
           }
         } catch (error) {
-          console.error(`Payment failed with ${providerType}:`, error);
+          console.error('Payment failed with %s:', providerType, error);
           continue;
         }
       }
@@ -1,6 +1,6 @@
 // Central service registry for managing all integrations
 
-import { PaymentServiceManager } from './provider-factory';
+import { PaymentServiceManager, paymentServiceManager } from './provider-factory';
 import { 
   ModernTreasuryProvider, 
   PlaidProvider, 
@@ -34,6 +34,37 @@ import {
   PropertyTaxService 
 } from './specialized-government';
 
+type ServiceConstructor = new (config: any) => any;
+
+// Constructors for the configurable (non-payment) service types, keyed by
+// service type and then provider name
+const SERVICE_CONSTRUCTORS = new Map<string, Map<string, ServiceConstructor>>([
+  ['banking', new Map<string, ServiceConstructor>([
+    ['modern_treasury', ModernTreasuryProvider],
+    ['plaid', PlaidProvider],
+    ['unit', UnitProvider],
+    ['dwolla', DwollaProvider],
+  ])],
+  ['compliance', new Map<string, ServiceConstructor>([
+    ['thomson_reuters', ThomsonReutersProvider],
+    ['lexisnexis', LexisNexisProvider],
+    ['verafin', VerafinProvider],
+    ['ofac', OFACProvider],
+  ])],
+  ['government', new Map<string, ServiceConstructor>([
+    ['adp', ADPProvider],
+    ['quickbooks', QuickBooksProvider],
+    ['salesforce', SalesforceProvider],
+    ['docusign', DocuSignProvider],
+    ['govdelivery', GovDeliveryProvider],
+  ])],
+  ['audit', new Map<string, ServiceConstructor>([
+    ['datasnipper', DataSnipperProvider],
+    ['mindbridge', MindBridgeProvider],
+    ['workiva', WorkivaProvider],
+  ])],
+]);
+
 export interface ServiceConfig {
   organizationId: string;
   serviceType: string;
@@ -52,7 +83,9 @@ export class IntegratedServiceRegistry {
   private treasuryService: TreasuryManagementService;
 
   constructor() {
-    this.paymentManager = new PaymentServiceManager();
+    // Share the process-wide manager so providers registered here are the same
+    // initialized instances bulk payment processing uses
+    this.paymentManager = paymentServiceManager;
     this.treasuryService = new TreasuryManagementService();
     
     // Initialize specialized services (these don't require external configs)
@@ -74,7 +107,7 @@ export class IntegratedServiceRegistry {
           break;
           
         case 'banking':
-          const bankingService = this.createBankingService(config.provider, config.configuration);
+          const bankingService = this.createService('banking', config.provider, config.configuration);
           if (bankingService) {
             await bankingService.initialize();
             this.bankingServices.set(serviceId, bankingService);
@@ -82,7 +115,7 @@ export class IntegratedServiceRegistry {
           break;
           
         case 'compliance':
-          const complianceService = this.createComplianceService(config.provider, config.configuration);
+          const complianceService = this.createService('compliance', config.provider, config.configuration);
           if (complianceService) {
             await complianceService.initialize();
             this.complianceServices.set(serviceId, complianceService);
@@ -90,7 +123,7 @@ export class IntegratedServiceRegistry {
           break;
           
         case 'government':
-          const govService = this.createGovernmentService(config.provider, config.configuration);
+          const govService = this.createService('government', config.provider, config.configuration);
           if (govService) {
             await govService.initialize();
             this.governmentServices.set(serviceId, govService);
@@ -98,7 +131,7 @@ export class IntegratedServiceRegistry {
           break;
           
         case 'audit':
-          const auditService = this.createAuditService(config.provider, config.configuration);
+          const auditService = this.createService('audit', config.provider, config.configuration);
           if (auditService) {
             await auditService.initialize();
             this.auditServices.set(serviceId, auditService);
@@ -178,65 +211,13 @@ export class IntegratedServiceRegistry {
     return services;
   }
 
-  // Service factory methods
-  private createBankingService(provider: string, config: any): any {
-    switch (provider) {
-      case 'modern_treasury':
-        return new ModernTreasuryProvider(config);
-      case 'plaid':
-        return new PlaidProvider(config);
-      case 'unit':
-        return new UnitProvider(config);
-      case 'dwolla':
-        return new DwollaProvider(config);
-      default:
-        throw new Error(`Unsupported banking provider: ${provider}`);
-    }
-  }
-
-  private createComplianceService(provider: string, config: any): any {
-    switch (provider) {
-      case 'thomson_reuters':
-        return new ThomsonReutersProvider(config);
-      case 'lexisnexis':
-        return new LexisNexisProvider(config);
-      case 'verafin':
-        return new VerafinProvider(config);
-      case 'ofac':
-        return new OFACProvider(config);
-      default:
-        throw new Error(`Unsupported compliance provider: ${provider}`);
-    }
-  }
-
-  private createGovernmentService(provider: string, config: any): any {
-    switch (provider) {
-      case 'adp':
-        return new ADPProvider(config);
-      case 'quickbooks':
-        return new QuickBooksProvider(config);
-      case 'salesforce':
-        return new SalesforceProvider(config);
-      case 'docusign':
-        return new DocuSignProvider(config);
-      case 'govdelivery':
-        return new GovDeliveryProvider(config);
-      default:
-        throw new Error(`Unsupported government provider: ${provider}`);
-    }
-  }
-
-  private createAuditService(provider: string, config: any): any {
-    switch (provider) {
-      case 'datasnipper':
-        return new DataSnipperProvider(config);
-      case 'mindbridge':
-        return new MindBridgeProvider(config);
-      case 'workiva':
-        return new WorkivaProvider(config);
-      default:
-        throw new Error(`Unsupported audit provider: ${provider}`);
+  // Service factory
+  private createService(serviceType: string, provider: string, config: any): any {
+    const Service = SERVICE_CONSTRUCTORS.get(serviceType)?.get(provider);
+    if (!Service) {
+      throw new Error(`Unsupported ${serviceType} provider: ${provider}`);
     }
+    return new Service(config);
   }
 
   // Comprehensive service health check
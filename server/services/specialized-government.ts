@@ -1,7 +1,5 @@
 // Specialized government functions and services
 
-import { BaseProvider, BaseProviderConfig } from './base-provider';
-
 // E-Procurement Management Service
 export class EProcurementService {
   async createRFP(rfpData: Record<string, any>): Promise<{ success: boolean; rfpId?: string; publicationDate?: string; error?: string }> {
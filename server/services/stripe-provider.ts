@@ -1,11 +1,16 @@
 import Stripe from 'stripe';
-import { BaseProvider, BaseProviderConfig, PaymentResult, TransferResult, CardIssueResult, ComplianceResult } from './base-provider';
+import * as https from 'https';
+import { BaseProvider, BaseProviderConfig, PROVIDER_REQUEST_TIMEOUT_MS, PaymentResult, TransferResult, CardIssueResult, ComplianceResult } from './base-provider';
 
 export interface StripeConfig extends BaseProviderConfig {
   stripeSecretKey: string;
   stripePublishableKey: string;
 }
 
+// Shared keep-alive agent so every Stripe client reuses pooled TLS
+// connections instead of paying a new handshake per API call.
+const stripeHttpAgent = new https.Agent({ keepAlive: true, maxSockets: 50 });
+
 export class StripeProvider extends BaseProvider {
   private stripe: Stripe;
 
@@ -13,13 +18,17 @@ export class StripeProvider extends BaseProvider {
     super(config);
     this.stripe = new Stripe(config.stripeSecretKey, {
       apiVersion: '2025-08-27.basil',
+      httpAgent: stripeHttpAgent,
+      timeout: PROVIDER_REQUEST_TIMEOUT_MS,
     });
   }
 
   async initialize(): Promise<void> {
     try {
-      // Test connection
-      await this.stripe.accounts.retrieve();
+      // Test connection with the balance endpoint; it authenticates the key just
+      // like retrieving the account, without pulling the full Account object
+      // (settings, capabilities, requirements) that nothing here uses
+      await this.stripe.balance.retrieve();
       this.logTransaction('initialize', { status: 'success' });
     } catch (error) {
       this.logTransaction('initialize', { status: 'error', error: error instanceof Error ? error.message : 'Unknown error' });
@@ -36,7 +45,7 @@ export class StripeProvider extends BaseProvider {
   }
 
   async processPayment(amount: number, currency: string = 'usd', metadata?: Record<string, any>): Promise<PaymentResult> {
-    try {
+    return this.providerCall<PaymentResult>('processPayment', 'Payment processing failed', async () => {
       if (!this.validateAmount(amount)) {
         return { success: false, error: 'Invalid amount' };
       }
@@ -60,15 +69,7 @@ export class StripeProvider extends BaseProvider {
         providerTransactionId: paymentIntent.id,
         metadata: { clientSecret: paymentIntent.client_secret }
       };
-    } catch (error) {
-      this.logTransaction('processPayment', { 
-        error: error instanceof Error ? error.message : 'Unknown error' 
-      });
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'Payment processing failed' 
-      };
-    }
+    });
   }
 
   async processACH(
@@ -77,7 +78,7 @@ export class StripeProvider extends BaseProvider {
     toAccount: string, 
     type: 'standard' | 'same_day' | 'next_day' = 'standard'
   ): Promise<TransferResult> {
-    try {
+    return this.providerCall<TransferResult>('processACH', 'ACH transfer failed', async () => {
       // Create ACH transfer using Stripe Connect
       const transfer = await this.stripe.transfers.create({
         amount: this.formatAmount(amount),
@@ -116,12 +117,7 @@ export class StripeProvider extends BaseProvider {
         estimatedSettlement,
         fees: 0 // Stripe fees would be calculated based on type
       };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'ACH transfer failed' 
-      };
-    }
+    });
   }
 
   async issueCard(
@@ -129,7 +125,7 @@ export class StripeProvider extends BaseProvider {
     type: 'debit' | 'credit' | 'virtual' = 'virtual',
     limits?: Record<string, number>
   ): Promise<CardIssueResult> {
-    try {
+    return this.providerCall<CardIssueResult>('issueCard', 'Card issuance failed', async () => {
       // Create card using Stripe Issuing
       const card = await this.stripe.issuing.cards.create({
         cardholder: await this.createCardHolder(holderName),
@@ -157,16 +153,11 @@ export class StripeProvider extends BaseProvider {
         expiryDate: `${card.exp_month}/${card.exp_year}`,
         status: card.status as 'active' | 'pending' | 'blocked'
       };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'Card issuance failed' 
-      };
-    }
+    });
   }
 
   async blockCard(cardId: string): Promise<PaymentResult> {
-    try {
+    return this.providerCall<PaymentResult>('blockCard', 'Card blocking failed', async () => {
       await this.stripe.issuing.cards.update(cardId, {
         status: 'canceled'
       });
@@ -174,16 +165,11 @@ export class StripeProvider extends BaseProvider {
       this.logTransaction('blockCard', { cardId });
 
       return { success: true, transactionId: cardId };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'Card blocking failed' 
-      };
-    }
+    });
   }
 
   async activateCard(cardId: string): Promise<PaymentResult> {
-    try {
+    return this.providerCall<PaymentResult>('activateCard', 'Card activation failed', async () => {
       await this.stripe.issuing.cards.update(cardId, {
         status: 'active'
       });
@@ -191,12 +177,7 @@ export class StripeProvider extends BaseProvider {
       this.logTransaction('activateCard', { cardId });
 
       return { success: true, transactionId: cardId };
-    } catch (error) {
-      return { 
-        success: false, 
-        error: error instanceof Error ? error.message : 'Card activation failed' 
-      };
-    }
+    });
   }
 
   async processWire(amount: number, fromAccount: string, toAccount: string, type: 'domestic' | 'international'): Promise<TransferResult> {
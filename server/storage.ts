@@ -29,6 +29,7 @@ import {
 } from "@shared/schema";
 import { db } from "./db";
 import { eq, desc, and, sql, sum } from "drizzle-orm";
+import memoize from "memoizee";
 
 export interface IStorage {
   // User operations (mandatory for Replit Auth)
@@ -65,6 +66,7 @@ export interface IStorage {
   
   // Expense operations
   getExpenses(organizationId: string): Promise<Expense[]>;
+  getExpensesBySubmitter(organizationId: string, submittedBy: string): Promise<Expense[]>;
   getExpense(id: string): Promise<Expense | undefined>;
   createExpense(expense: InsertExpense): Promise<Expense>;
   updateExpense(id: string, expense: Partial<InsertExpense>): Promise<Expense>;
@@ -90,11 +92,33 @@ export interface IStorage {
   getRecentActivity(organizationId: string): Promise<any[]>;
 }
 
+// Nearly every authenticated route resolves the current user first, so the
+// lookup is prepared once (lazily, on first use) and reused with bound params.
+function prepareGetUserById() {
+  return db
+    .select()
+    .from(users)
+    .where(eq(users.id, sql.placeholder("id")))
+    .prepare("get_user_by_id");
+}
+
+let getUserById: ReturnType<typeof prepareGetUserById> | undefined;
+
+// A page load fires several API calls that each resolve the same user, so
+// keep lookups for a few seconds. upsertUser drops the entry it changes.
+const getCachedUser = memoize(
+  async (id: string): Promise<User | undefined> => {
+    getUserById ??= prepareGetUserById();
+    const [user] = await getUserById.execute({ id });
+    return user;
+  },
+  { promise: true, maxAge: 5 * 1000 }
+);
+
 export class DatabaseStorage implements IStorage {
   // User operations (mandatory for Replit Auth)
   async getUser(id: string): Promise<User | undefined> {
-    const [user] = await db.select().from(users).where(eq(users.id, id));
-    return user;
+    return await getCachedUser(id);
   }
 
   async upsertUser(userData: UpsertUser): Promise<User> {
@@ -105,10 +129,11 @@ export class DatabaseStorage implements IStorage {
         target: users.id,
         set: {
           ...userData,
-          updatedAt: new Date(),
+          updatedAt: sql`now()`,
         },
       })
       .returning();
+    getCachedUser.delete(user.id);
     return user;
   }
 
@@ -155,7 +180,7 @@ export class DatabaseStorage implements IStorage {
   async updateBudget(id: string, budget: Partial<InsertBudget>): Promise<Budget> {
     const [updatedBudget] = await db
       .update(budgets)
-      .set({ ...budget, updatedAt: new Date() })
+      .set({ ...budget, updatedAt: sql`now()` })
       .where(eq(budgets.id, id))
       .returning();
     return updatedBudget;
@@ -202,7 +227,7 @@ export class DatabaseStorage implements IStorage {
   async updateVendor(id: string, vendor: Partial<InsertVendor>): Promise<Vendor> {
     const [updatedVendor] = await db
       .update(vendors)
-      .set({ ...vendor, updatedAt: new Date() })
+      .set({ ...vendor, updatedAt: sql`now()` })
       .where(eq(vendors.id, id))
       .returning();
     return updatedVendor;
@@ -233,7 +258,7 @@ export class DatabaseStorage implements IStorage {
   async updatePayment(id: string, payment: Partial<InsertPayment>): Promise<Payment> {
     const [updatedPayment] = await db
       .update(payments)
-      .set({ ...payment, updatedAt: new Date() })
+      .set({ ...payment, updatedAt: sql`now()` })
       .where(eq(payments.id, id))
       .returning();
     return updatedPayment;
@@ -261,6 +286,19 @@ export class DatabaseStorage implements IStorage {
       .orderBy(desc(expenses.createdAt));
   }
 
+  async getExpensesBySubmitter(organizationId: string, submittedBy: string): Promise<Expense[]> {
+    return await db
+      .select()
+      .from(expenses)
+      .where(
+        and(
+          eq(expenses.organizationId, organizationId),
+          eq(expenses.submittedBy, submittedBy)
+        )
+      )
+      .orderBy(desc(expenses.createdAt));
+  }
+
   async getExpense(id: string): Promise<Expense | undefined> {
     const [expense] = await db.select().from(expenses).where(eq(expenses.id, id));
     return expense;
@@ -277,7 +315,7 @@ export class DatabaseStorage implements IStorage {
   async updateExpense(id: string, expense: Partial<InsertExpense>): Promise<Expense> {
     const [updatedExpense] = await db
       .update(expenses)
-      .set({ ...expense, updatedAt: new Date() })
+      .set({ ...expense, updatedAt: sql`now()` })
       .where(eq(expenses.id, id))
       .returning();
     return updatedExpense;
@@ -308,7 +346,7 @@ export class DatabaseStorage implements IStorage {
   async updateDigitalWallet(id: string, wallet: Partial<InsertDigitalWallet>): Promise<DigitalWallet> {
     const [updatedWallet] = await db
       .update(digitalWallets)
-      .set({ ...wallet, updatedAt: new Date() })
+      .set({ ...wallet, updatedAt: sql`now()` })
       .where(eq(digitalWallets.id, id))
       .returning();
     return updatedWallet;
@@ -338,53 +376,58 @@ export class DatabaseStorage implements IStorage {
     activeVendors: number;
     pendingPayments: number;
   }> {
-    const currentYear = new Date().getFullYear();
+    // Read the clock once so the year and month filters always agree
+    const now = new Date();
+    const currentYear = now.getFullYear();
+    const currentMonth = now.getMonth() + 1;
     
-    // Get total budget for current year
-    const budgetResult = await db
-      .select({ total: sum(budgets.totalAmount) })
-      .from(budgets)
-      .where(
-        and(
-          eq(budgets.organizationId, organizationId),
-          eq(budgets.fiscalYear, currentYear)
-        )
-      );
-
-    // Get monthly expenses (current month)
-    const currentMonth = new Date().getMonth() + 1;
-    const expenseResult = await db
-      .select({ total: sum(expenses.amount) })
-      .from(expenses)
-      .where(
-        and(
-          eq(expenses.organizationId, organizationId),
-          sql`EXTRACT(MONTH FROM ${expenses.expenseDate}) = ${currentMonth}`,
-          sql`EXTRACT(YEAR FROM ${expenses.expenseDate}) = ${currentYear}`
-        )
-      );
-
-    // Get active vendors count
-    const vendorResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(vendors)
-      .where(
-        and(
-          eq(vendors.organizationId, organizationId),
-          eq(vendors.status, "active")
-        )
-      );
-
-    // Get pending payments count
-    const pendingPaymentsResult = await db
-      .select({ count: sql<number>`count(*)` })
-      .from(payments)
-      .where(
-        and(
-          eq(payments.organizationId, organizationId),
-          eq(payments.status, "pending")
-        )
-      );
+    // The four aggregates are independent, so run them concurrently
+    const [budgetResult, expenseResult, vendorResult, pendingPaymentsResult] = await Promise.all([
+      // Total budget for current year
+      db
+        .select({ total: sum(budgets.totalAmount) })
+        .from(budgets)
+        .where(
+          and(
+            eq(budgets.organizationId, organizationId),
+            eq(budgets.fiscalYear, currentYear)
+          )
+        ),
+
+      // Monthly expenses (current month)
+      db
+        .select({ total: sum(expenses.amount) })
+        .from(expenses)
+        .where(
+          and(
+            eq(expenses.organizationId, organizationId),
+            sql`EXTRACT(MONTH FROM ${expenses.expenseDate}) = ${currentMonth}`,
+            sql`EXTRACT(YEAR FROM ${expenses.expenseDate}) = ${currentYear}`
+          )
+        ),
+
+      // Active vendors count
+      db
+        .select({ count: sql<number>`count(*)` })
+        .from(vendors)
+        .where(
+          and(
+            eq(vendors.organizationId, organizationId),
+            eq(vendors.status, "active")
+          )
+        ),
+
+      // Pending payments count
+      db
+        .select({ count: sql<number>`count(*)` })
+        .from(payments)
+        .where(
+          and(
+            eq(payments.organizationId, organizationId),
+            eq(payments.status, "pending")
+          )
+        ),
+    ]);
 
     return {
       totalBudget: budgetResult[0]?.total || "0",
@@ -404,45 +447,47 @@ export class DatabaseStorage implements IStorage {
   }
 
   async getRecentActivity(organizationId: string): Promise<any[]> {
-    // Get recent payments, expenses, and vendor registrations
-    const recentPayments = await db
-      .select({
-        id: payments.id,
-        type: sql<string>`'payment'`,
-        description: payments.description,
-        amount: payments.amount,
-        createdAt: payments.createdAt,
-      })
-      .from(payments)
-      .where(eq(payments.organizationId, organizationId))
-      .orderBy(desc(payments.createdAt))
-      .limit(5);
-
-    const recentExpenses = await db
-      .select({
-        id: expenses.id,
-        type: sql<string>`'expense'`,
-        description: expenses.description,
-        amount: expenses.amount,
-        createdAt: expenses.createdAt,
-      })
-      .from(expenses)
-      .where(eq(expenses.organizationId, organizationId))
-      .orderBy(desc(expenses.createdAt))
-      .limit(5);
-
-    const recentVendors = await db
-      .select({
-        id: vendors.id,
-        type: sql<string>`'vendor'`,
-        description: vendors.name,
-        amount: sql<string>`null`,
-        createdAt: vendors.createdAt,
-      })
-      .from(vendors)
-      .where(eq(vendors.organizationId, organizationId))
-      .orderBy(desc(vendors.createdAt))
-      .limit(5);
+    // Get recent payments, expenses, and vendor registrations concurrently
+    const [recentPayments, recentExpenses, recentVendors] = await Promise.all([
+      db
+        .select({
+          id: payments.id,
+          type: sql<string>`'payment'`,
+          description: payments.description,
+          amount: payments.amount,
+          createdAt: payments.createdAt,
+        })
+        .from(payments)
+        .where(eq(payments.organizationId, organizationId))
+        .orderBy(desc(payments.createdAt))
+        .limit(5),
+
+      db
+        .select({
+          id: expenses.id,
+          type: sql<string>`'expense'`,
+          description: expenses.description,
+          amount: expenses.amount,
+          createdAt: expenses.createdAt,
+        })
+        .from(expenses)
+        .where(eq(expenses.organizationId, organizationId))
+        .orderBy(desc(expenses.createdAt))
+        .limit(5),
+
+      db
+        .select({
+          id: vendors.id,
+          type: sql<string>`'vendor'`,
+          description: vendors.name,
+          amount: sql<string>`null`,
+          createdAt: vendors.createdAt,
+        })
+        .from(vendors)
+        .where(eq(vendors.organizationId, organizationId))
+        .orderBy(desc(vendors.createdAt))
+        .limit(5),
+    ]);
 
     // Combine and sort all activities
     const allActivities = [...recentPayments, ...recentExpenses, ...recentVendors];
@@ -361,13 +361,15 @@ class TwoFactorService {
   private verifyTOTP(code: string, secret: string): boolean {
     // Simple TOTP verification (in production, use a proper TOTP library)
     const counter = Math.floor(Date.now() / 1000 / 30);
+    // Decode the key once and reuse one 8-byte counter buffer for all windows;
+    // the counter fits in the low 32 bits, so the high word stays zero
+    const key = Buffer.from(secret, 'hex');
+    const counterBuffer = Buffer.alloc(8);
     
     // Check current and adjacent time windows
     for (let i = -1; i <= 1; i++) {
-      const testCounter = counter + i;
-      const hmac = crypto.createHmac('sha1', Buffer.from(secret, 'hex'));
-      hmac.update(Buffer.from(testCounter.toString(16).padStart(16, '0'), 'hex'));
-      const hash = hmac.digest();
+      counterBuffer.writeUInt32BE(counter + i, 4);
+      const hash = crypto.createHmac('sha1', key).update(counterBuffer).digest();
       
       const offset = hash[hash.length - 1] & 0xf;
       const binary = 
@@ -78,8 +78,13 @@ export function serveStatic(app: Express) {
 
   app.use(express.static(distPath));
 
+  // The built index.html never changes while the server runs, so read it once
+  // instead of stat-ing and streaming it from disk for every client route.
+  // res.send still derives an ETag from the buffer for conditional requests.
+  const indexHtml = fs.readFileSync(path.resolve(distPath, "index.html"));
+
   // fall through to index.html if the file doesn't exist
   app.use("*", (_req, res) => {
-    res.sendFile(path.resolve(distPath, "index.html"));
+    res.set("Cache-Control", "no-cache").type("html").send(indexHtml);
   });
 }
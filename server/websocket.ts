@@ -1,6 +1,6 @@
 import { WebSocketServer, WebSocket } from 'ws';
 import type { Server } from 'http';
-import { storage } from './storage';
+import { nanoid } from 'nanoid';
 
 interface WSMessage {
   type: 'notification' | 'update' | 'alert' | 'broadcast';
@@ -32,8 +32,13 @@ class WebSocketManager {
     this.wss.on('connection', (ws: WebSocket, request) => {
       const clientId = this.generateClientId();
       
+      // Declare every field up front so all client records share one object
+      // shape instead of transitioning when auth fills in the identity fields
       const client: WSClient = {
         ws,
+        userId: undefined,
+        organizationId: undefined,
+        role: undefined,
         isAlive: true
       };
 
@@ -69,7 +74,7 @@ class WebSocketManager {
       });
 
       ws.on('error', (error) => {
-        console.error(`WebSocket error for client ${clientId}:`, error);
+        console.error('WebSocket error for client %s:', clientId, error);
       });
     });
 
@@ -96,7 +101,7 @@ class WebSocketManager {
 
       case 'subscribe':
         // Subscribe to specific channels
-        console.log(`Client ${clientId} subscribing to:`, message.channels);
+        console.log('Client %s subscribing to:', clientId, message.channels);
         break;
 
       case 'ping':
@@ -106,40 +111,36 @@ class WebSocketManager {
     }
   }
 
-  // Send notification to specific user
-  sendToUser(userId: string, message: WSMessage) {
+  // Serialize a message once and send it to every open client that matches,
+  // rather than re-stringifying the same payload per recipient
+  private sendWhere(matches: (client: WSClient) => boolean, message: WSMessage) {
+    let payload: string | undefined;
     this.clients.forEach((client) => {
-      if (client.userId === userId && client.ws.readyState === WebSocket.OPEN) {
-        client.ws.send(JSON.stringify(message));
+      if (matches(client) && client.ws.readyState === WebSocket.OPEN) {
+        payload ??= JSON.stringify(message);
+        client.ws.send(payload);
       }
     });
   }
 
+  // Send notification to specific user
+  sendToUser(userId: string, message: WSMessage) {
+    this.sendWhere((client) => client.userId === userId, message);
+  }
+
   // Send notification to all users in organization
   sendToOrganization(organizationId: string, message: WSMessage) {
-    this.clients.forEach((client) => {
-      if (client.organizationId === organizationId && client.ws.readyState === WebSocket.OPEN) {
-        client.ws.send(JSON.stringify(message));
-      }
-    });
+    this.sendWhere((client) => client.organizationId === organizationId, message);
   }
 
   // Broadcast to all connected clients
   broadcast(message: WSMessage) {
-    this.clients.forEach((client) => {
-      if (client.ws.readyState === WebSocket.OPEN) {
-        client.ws.send(JSON.stringify(message));
-      }
-    });
+    this.sendWhere(() => true, message);
   }
 
   // Send role-based notifications
   sendToRole(role: string, message: WSMessage) {
-    this.clients.forEach((client) => {
-      if (client.role === role && client.ws.readyState === WebSocket.OPEN) {
-        client.ws.send(JSON.stringify(message));
-      }
-    });
+    this.sendWhere((client) => client.role === role, message);
   }
 
   // Heartbeat to keep connections alive
@@ -159,7 +160,7 @@ class WebSocketManager {
   }
 
   private generateClientId(): string {
-    return Math.random().toString(36).substring(2) + Date.now().toString(36);
+    return nanoid();
   }
 
   // Clean up on server shutdown
@@ -6,8 +6,6 @@ import {
   workflowNotifications,
   type Workflow,
   type InsertWorkflow,
-  type WorkflowApproval,
-  type InsertWorkflowApproval,
   type InsertWorkflowNotification
 } from '@shared/workflow-schema';
 import { eq, and, desc, gte } from 'drizzle-orm';
@@ -0,0 +1,21 @@
+// Money columns are stored as NUMERIC(15,2) and arrive as strings. Summing
+// them as floats accumulates rounding error, so aggregate in integer cents
+// and convert back once at the end.
+
+export function toCents(amount: string | number | null | undefined): number {
+  if (amount === null || amount === undefined || amount === "") return 0;
+  const value = typeof amount === "number" ? amount : parseFloat(amount);
+  return Number.isFinite(value) ? Math.round(value * 100) : 0;
+}
+
+export function fromCents(cents: number): number {
+  return cents / 100;
+}
+
+export function sumCents<T>(items: T[], pick: (item: T) => string | number | null | undefined): number {
+  let total = 0;
+  for (const item of items) {
+    total += toCents(pick(item));
+  }
+  return total;
+}
@@ -31,6 +31,10 @@ export const users = pgTable("users", {
   email: varchar("email").unique(),
   firstName: varchar("first_name"),
   lastName: varchar("last_name"),
+  // Maintained by Postgres so display paths don't rebuild it per row
+  fullName: text("full_name").generatedAlwaysAs(
+    sql`trim(coalesce(first_name, '') || ' ' || coalesce(last_name, ''))`
+  ),
   profileImageUrl: varchar("profile_image_url"),
   role: varchar("role").notNull().default("user"),
   organizationId: varchar("organization_id"),
@@ -57,106 +61,152 @@ export const vendorStatusEnum = pgEnum("vendor_status", ["active", "inactive", "
 export const walletTypeEnum = pgEnum("wallet_type", ["checking", "savings", "payroll", "expense", "tax_collection", "treasury", "investment", "escrow", "grant", "utility", "digital"]);
  export const transactionTypeEnum = pgEnum("transaction_type", ["debit", "credit", "transfer", "fee", "interest", "dividend", "withdrawal", "deposit", "purchase", "sale", "exchange", "reversal", "adjustment"]); // Add more as needed         
 
-export const budgets = pgTable("budgets", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  name: varchar("name").notNull(),
-  description: text("description"),
-  organizationId: varchar("organization_id").notNull(),
-  fiscalYear: integer("fiscal_year").notNull(),
-  totalAmount: decimal("total_amount", { precision: 15, scale: 2 }).notNull(),
-  allocatedAmount: decimal("allocated_amount", { precision: 15, scale: 2 }).default("0"),
-  spentAmount: decimal("spent_amount", { precision: 15, scale: 2 }).default("0"),
-  status: budgetStatusEnum("status").default("draft"),
-  startDate: timestamp("start_date").notNull(),
-  endDate: timestamp("end_date").notNull(),
-  createdBy: varchar("created_by").notNull(),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const budgets = pgTable(
+  "budgets",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    name: varchar("name").notNull(),
+    description: text("description"),
+    organizationId: varchar("organization_id").notNull(),
+    fiscalYear: integer("fiscal_year").notNull(),
+    totalAmount: decimal("total_amount", { precision: 15, scale: 2 }).notNull(),
+    allocatedAmount: decimal("allocated_amount", { precision: 15, scale: 2 }).default("0"),
+    spentAmount: decimal("spent_amount", { precision: 15, scale: 2 }).default("0"),
+    status: budgetStatusEnum("status").default("draft"),
+    startDate: timestamp("start_date").notNull(),
+    endDate: timestamp("end_date").notNull(),
+    createdBy: varchar("created_by").notNull(),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_budgets_org_fiscal_year").on(table.organizationId, table.fiscalYear),
+  ],
+);
 
-export const budgetCategories = pgTable("budget_categories", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  name: varchar("name").notNull(),
-  budgetId: varchar("budget_id").notNull(),
-  allocatedAmount: decimal("allocated_amount", { precision: 15, scale: 2 }).notNull(),
-  spentAmount: decimal("spent_amount", { precision: 15, scale: 2 }).default("0"),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const budgetCategories = pgTable(
+  "budget_categories",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    name: varchar("name").notNull(),
+    budgetId: varchar("budget_id").notNull(),
+    allocatedAmount: decimal("allocated_amount", { precision: 15, scale: 2 }).notNull(),
+    spentAmount: decimal("spent_amount", { precision: 15, scale: 2 }).default("0"),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_budget_categories_budget").on(table.budgetId),
+  ],
+);
 
-export const vendors = pgTable("vendors", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  name: varchar("name").notNull(),
-  email: varchar("email"),
-  phone: varchar("phone"),
-  address: text("address"),
-  taxId: varchar("tax_id"),
-  businessType: varchar("business_type"),
-  status: vendorStatusEnum("status").default("pending_approval"),
-  organizationId: varchar("organization_id").notNull(),
-  totalSpend: decimal("total_spend", { precision: 15, scale: 2 }).default("0"),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const vendors = pgTable(
+  "vendors",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    name: varchar("name").notNull(),
+    email: varchar("email"),
+    phone: varchar("phone"),
+    address: text("address"),
+    taxId: varchar("tax_id"),
+    businessType: varchar("business_type"),
+    status: vendorStatusEnum("status").default("pending_approval"),
+    organizationId: varchar("organization_id").notNull(),
+    totalSpend: decimal("total_spend", { precision: 15, scale: 2 }).default("0"),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_vendors_org_status").on(table.organizationId, table.status),
+  ],
+);
 
-export const payments = pgTable("payments", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
-  description: text("description"),
-  type: paymentTypeEnum("type").notNull(),
-  status: paymentStatusEnum("status").default("pending"),
-  vendorId: varchar("vendor_id"),
-  budgetCategoryId: varchar("budget_category_id"),
-  organizationId: varchar("organization_id").notNull(),
-  dueDate: timestamp("due_date"),
-  processedDate: timestamp("processed_date"),
-  createdBy: varchar("created_by").notNull(),
-  approvedBy: varchar("approved_by"),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const payments = pgTable(
+  "payments",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
+    description: text("description"),
+    type: paymentTypeEnum("type").notNull(),
+    status: paymentStatusEnum("status").default("pending"),
+    vendorId: varchar("vendor_id"),
+    budgetCategoryId: varchar("budget_category_id"),
+    organizationId: varchar("organization_id").notNull(),
+    dueDate: timestamp("due_date"),
+    processedDate: timestamp("processed_date"),
+    createdBy: varchar("created_by").notNull(),
+    approvedBy: varchar("approved_by"),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_payments_org_status").on(table.organizationId, table.status),
+    index("IDX_payments_org_created").on(table.organizationId, table.createdAt),
+    index("IDX_payments_vendor").on(table.vendorId),
+  ],
+);
 
-export const expenses = pgTable("expenses", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
-  description: text("description").notNull(),
-  status: expenseStatusEnum("status").default("draft"),
-  category: varchar("category"),
-  receiptUrl: varchar("receipt_url"),
-  expenseDate: timestamp("expense_date").notNull(),
-  submittedBy: varchar("submitted_by").notNull(),
-  approvedBy: varchar("approved_by"),
-  budgetCategoryId: varchar("budget_category_id"),
-  organizationId: varchar("organization_id").notNull(),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const expenses = pgTable(
+  "expenses",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
+    description: text("description").notNull(),
+    status: expenseStatusEnum("status").default("draft"),
+    category: varchar("category"),
+    receiptUrl: varchar("receipt_url"),
+    expenseDate: timestamp("expense_date").notNull(),
+    submittedBy: varchar("submitted_by").notNull(),
+    approvedBy: varchar("approved_by"),
+    budgetCategoryId: varchar("budget_category_id"),
+    organizationId: varchar("organization_id").notNull(),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_expenses_org_submitter").on(table.organizationId, table.submittedBy),
+    index("IDX_expenses_org_date").on(table.organizationId, table.expenseDate),
+  ],
+);
 
-export const digitalWallets = pgTable("digital_wallets", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  name: varchar("name").notNull(),
-  type: walletTypeEnum("type").notNull(),
-  balance: decimal("balance", { precision: 15, scale: 2 }).default("0"),
-  accountNumber: varchar("account_number"),
-  routingNumber: varchar("routing_number"),
-  isActive: boolean("is_active").default(true),
-  organizationId: varchar("organization_id").notNull(),
-  externalAccountId: varchar("external_account_id"), // for integration with banking APIs
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const digitalWallets = pgTable(
+  "digital_wallets",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    name: varchar("name").notNull(),
+    type: walletTypeEnum("type").notNull(),
+    balance: decimal("balance", { precision: 15, scale: 2 }).default("0"),
+    accountNumber: varchar("account_number"),
+    routingNumber: varchar("routing_number"),
+    isActive: boolean("is_active").default(true),
+    organizationId: varchar("organization_id").notNull(),
+    externalAccountId: varchar("external_account_id"), // for integration with banking APIs
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_digital_wallets_org").on(table.organizationId),
+  ],
+);
 
-export const transactions = pgTable("transactions", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
-  type: varchar("type").notNull(), // debit, credit
-  description: text("description"),
-  walletId: varchar("wallet_id").notNull(),
-  paymentId: varchar("payment_id"),
-  expenseId: varchar("expense_id"),
-  organizationId: varchar("organization_id").notNull(),
-  createdAt: timestamp("created_at").defaultNow(),
-});
+export const transactions = pgTable(
+  "transactions",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
+    type: varchar("type").notNull(), // debit, credit
+    description: text("description"),
+    walletId: varchar("wallet_id").notNull(),
+    paymentId: varchar("payment_id"),
+    expenseId: varchar("expense_id"),
+    organizationId: varchar("organization_id").notNull(),
+    createdAt: timestamp("created_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_transactions_org_created").on(table.organizationId, table.createdAt),
+    index("IDX_transactions_wallet").on(table.walletId),
+  ],
+);
 
 // Payment Provider and Integration Enums
 export const paymentProviderEnum = pgEnum("payment_provider", ["stripe", "paypal", "square", "unit", "modern_treasury", "saltedge", "plaid", "dwolla", "wise", "circle", "coinbase"]);
@@ -201,26 +251,32 @@ export const integrations = pgTable("integrations", {
 });
 
 // Card Issuing and Management
-export const issuedCards = pgTable("issued_cards", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  cardNumber: varchar("card_number").notNull(), // encrypted
-  cardType: cardTypeEnum("card_type").notNull(),
-  status: cardStatusEnum("status").default("pending"),
-  holderName: varchar("holder_name").notNull(),
-  holderId: varchar("holder_id").notNull(), // user or employee ID
-  organizationId: varchar("organization_id").notNull(),
-  walletId: varchar("wallet_id"),
-  provider: paymentProviderEnum("provider").notNull(),
-  externalCardId: varchar("external_card_id"), // provider's card ID
-  spendingLimit: decimal("spending_limit", { precision: 15, scale: 2 }),
-  monthlyLimit: decimal("monthly_limit", { precision: 15, scale: 2 }),
-  allowedCategories: text("allowed_categories").array().default([]),
-  blockedCategories: text("blocked_categories").array().default([]),
-  expiryDate: timestamp("expiry_date"),
-  isVirtual: boolean("is_virtual").default(false),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const issuedCards = pgTable(
+  "issued_cards",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    cardNumber: varchar("card_number").notNull(), // encrypted
+    cardType: cardTypeEnum("card_type").notNull(),
+    status: cardStatusEnum("status").default("pending"),
+    holderName: varchar("holder_name").notNull(),
+    holderId: varchar("holder_id").notNull(), // user or employee ID
+    organizationId: varchar("organization_id").notNull(),
+    walletId: varchar("wallet_id"),
+    provider: paymentProviderEnum("provider").notNull(),
+    externalCardId: varchar("external_card_id"), // provider's card ID
+    spendingLimit: decimal("spending_limit", { precision: 15, scale: 2 }),
+    monthlyLimit: decimal("monthly_limit", { precision: 15, scale: 2 }),
+    allowedCategories: text("allowed_categories").array().default([]),
+    blockedCategories: text("blocked_categories").array().default([]),
+    expiryDate: timestamp("expiry_date"),
+    isVirtual: boolean("is_virtual").default(false),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_issued_cards_holder").on(table.holderId),
+  ],
+);
 
 // Bank Accounts (for ACH, Wire, etc.)
 export const bankAccounts = pgTable("bank_accounts", {
@@ -262,42 +318,60 @@ export const complianceRecords = pgTable("compliance_records", {
 });
 
 // Audit Trails and Logs
-export const auditLogs = pgTable("audit_logs", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  organizationId: varchar("organization_id").notNull(),
-  userId: varchar("user_id"),
-  action: varchar("action").notNull(),
-  entityType: varchar("entity_type").notNull(),
-  entityId: varchar("entity_id"),
-  oldValues: jsonb("old_values"),
-  newValues: jsonb("new_values"),
-  ipAddress: varchar("ip_address"),
-  userAgent: varchar("user_agent"),
-  metadata: jsonb("metadata"),
-  createdAt: timestamp("created_at").defaultNow(),
-});
+export const auditLogs = pgTable(
+  "audit_logs",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    organizationId: varchar("organization_id").notNull(),
+    userId: varchar("user_id"),
+    action: varchar("action").notNull(),
+    entityType: varchar("entity_type").notNull(),
+    entityId: varchar("entity_id"),
+    oldValues: jsonb("old_values"),
+    newValues: jsonb("new_values"),
+    ipAddress: varchar("ip_address"),
+    userAgent: varchar("user_agent"),
+    metadata: jsonb("metadata"),
+    createdAt: timestamp("created_at").defaultNow(),
+  },
+  (table) => [
+    // Matches the audit trail's keyset order, see getAuditLogsByEntity
+    index("IDX_audit_logs_entity").on(
+      table.entityType,
+      table.entityId,
+      sql`date_trunc('milliseconds', ${table.createdAt})`,
+      table.id,
+    ),
+  ],
+);
 
 // Grant Management
-export const grants = pgTable("grants", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  organizationId: varchar("organization_id").notNull(),
-  grantorName: varchar("grantor_name").notNull(),
-  grantName: varchar("grant_name").notNull(),
-  grantNumber: varchar("grant_number"),
-  amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
-  amountReceived: decimal("amount_received", { precision: 15, scale: 2 }).default("0"),
-  amountSpent: decimal("amount_spent", { precision: 15, scale: 2 }).default("0"),
-  status: grantStatusEnum("status").default("applied"),
-  applicationDate: timestamp("application_date"),
-  startDate: timestamp("start_date"),
-  endDate: timestamp("end_date"),
-  purpose: text("purpose"),
-  restrictions: text("restrictions"),
-  reportingRequirements: text("reporting_requirements"),
-  managedBy: varchar("managed_by").notNull(),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const grants = pgTable(
+  "grants",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    organizationId: varchar("organization_id").notNull(),
+    grantorName: varchar("grantor_name").notNull(),
+    grantName: varchar("grant_name").notNull(),
+    grantNumber: varchar("grant_number"),
+    amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
+    amountReceived: decimal("amount_received", { precision: 15, scale: 2 }).default("0"),
+    amountSpent: decimal("amount_spent", { precision: 15, scale: 2 }).default("0"),
+    status: grantStatusEnum("status").default("applied"),
+    applicationDate: timestamp("application_date"),
+    startDate: timestamp("start_date"),
+    endDate: timestamp("end_date"),
+    purpose: text("purpose"),
+    restrictions: text("restrictions"),
+    reportingRequirements: text("reporting_requirements"),
+    managedBy: varchar("managed_by").notNull(),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_grants_managed_by").on(table.managedBy),
+  ],
+);
 
 // Asset Management
 export const assets = pgTable("assets", {
@@ -1059,32 +1133,39 @@ export const emergencyIncidents = pgTable('emergency_incidents', {
 });
 
 // Enhanced Transactions for Multi-Provider Support
-export const enhancedTransactions = pgTable("enhanced_transactions", {
-  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
-  amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
-  currency: varchar("currency").default("USD"),
-  type: varchar("type").notNull(), // debit, credit
-  paymentType: paymentTypeEnum("payment_type").notNull(),
-  provider: paymentProviderEnum("provider").notNull(),
-  providerTransactionId: varchar("provider_transaction_id"),
-  status: paymentStatusEnum("status").default("pending"),
-  description: text("description"),
-  fromAccountId: varchar("from_account_id"),
-  toAccountId: varchar("to_account_id"),
-  walletId: varchar("wallet_id"),
-  paymentId: varchar("payment_id"),
-  expenseId: varchar("expense_id"),
-  grantId: varchar("grant_id"),
-  assetId: varchar("asset_id"),
-  procurementId: varchar("procurement_id"),
-  organizationId: varchar("organization_id").notNull(),
-  fees: decimal("fees", { precision: 15, scale: 2 }).default("0"),
-  exchangeRate: decimal("exchange_rate", { precision: 10, scale: 6 }),
-  settlementDate: timestamp("settlement_date"),
-  metadata: jsonb("metadata"),
-  createdAt: timestamp("created_at").defaultNow(),
-  updatedAt: timestamp("updated_at").defaultNow(),
-});
+export const enhancedTransactions = pgTable(
+  "enhanced_transactions",
+  {
+    id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
+    amount: decimal("amount", { precision: 15, scale: 2 }).notNull(),
+    currency: varchar("currency").default("USD"),
+    type: varchar("type").notNull(), // debit, credit
+    paymentType: paymentTypeEnum("payment_type").notNull(),
+    provider: paymentProviderEnum("provider").notNull(),
+    providerTransactionId: varchar("provider_transaction_id"),
+    status: paymentStatusEnum("status").default("pending"),
+    description: text("description"),
+    fromAccountId: varchar("from_account_id"),
+    toAccountId: varchar("to_account_id"),
+    walletId: varchar("wallet_id"),
+    paymentId: varchar("payment_id"),
+    expenseId: varchar("expense_id"),
+    grantId: varchar("grant_id"),
+    assetId: varchar("asset_id"),
+    procurementId: varchar("procurement_id"),
+    organizationId: varchar("organization_id").notNull(),
+    fees: decimal("fees", { precision: 15, scale: 2 }).default("0"),
+    exchangeRate: decimal("exchange_rate", { precision: 10, scale: 6 }),
+    settlementDate: timestamp("settlement_date"),
+    metadata: jsonb("metadata"),
+    createdAt: timestamp("created_at").defaultNow(),
+    updatedAt: timestamp("updated_at").defaultNow(),
+  },
+  (table) => [
+    index("IDX_enhanced_transactions_org_created").on(table.organizationId, table.createdAt),
+    index("IDX_enhanced_transactions_org_provider_created").on(table.organizationId, table.provider, table.createdAt),
+  ],
+);
 
 // Enhanced Relations
 export const usersRelations = relations(users, ({ one, many }) => ({
@@ -1308,7 +1389,9 @@ export const bankAccountsRelations = relations(bankAccounts, ({ one, many }) =>
     fields: [bankAccounts.organizationId],
     references: [organizations.id],
   }),
-  enhancedTransactions: many(enhancedTransactions),
+  // Transactions reference bank accounts twice, so each side names its pair
+  outgoingTransactions: many(enhancedTransactions, { relationName: "fromAccount" }),
+  incomingTransactions: many(enhancedTransactions, { relationName: "toAccount" }),
 }));
 
 export const complianceRecordsRelations = relations(complianceRecords, ({ one }) => ({
@@ -1391,10 +1474,12 @@ export const enhancedTransactionsRelations = relations(enhancedTransactions, ({
   fromAccount: one(bankAccounts, {
     fields: [enhancedTransactions.fromAccountId],
     references: [bankAccounts.id],
+    relationName: "fromAccount",
   }),
   toAccount: one(bankAccounts, {
     fields: [enhancedTransactions.toAccountId],
     references: [bankAccounts.id],
+    relationName: "toAccount",
   }),
   wallet: one(digitalWallets, {
     fields: [enhancedTransactions.walletId],
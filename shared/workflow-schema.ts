@@ -1,3 +1,4 @@
+import { sql } from "drizzle-orm";
 import { 
   pgTable, 
   varchar, 
@@ -9,7 +10,6 @@ import {
   integer
 } from "drizzle-orm/pg-core";
 import { createInsertSchema } from "drizzle-zod";
-import { z } from "zod";
 
 // Workflow status enum
 export const workflowStatusEnum = pgEnum("workflow_status", [
@@ -77,7 +77,7 @@ export const workflowTypeEnum = pgEnum("workflow_type", [
 
 // Workflows table
 export const workflows = pgTable("workflows", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   type: workflowTypeEnum("type").notNull(),
   status: workflowStatusEnum("status").default("pending").notNull(),
   organizationId: varchar("organization_id").notNull(),
@@ -106,7 +106,7 @@ export const workflows = pgTable("workflows", {
 
 // Workflow approvals table
 export const workflowApprovals = pgTable("workflow_approvals", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   workflowId: varchar("workflow_id").notNull(),
   approverId: varchar("approver_id").notNull(),
   level: integer("level").notNull(),
@@ -124,7 +124,7 @@ export const workflowApprovals = pgTable("workflow_approvals", {
 
 // Workflow rules table
 export const workflowRules = pgTable("workflow_rules", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   organizationId: varchar("organization_id").notNull(),
   type: workflowTypeEnum("type").notNull(),
   
@@ -146,7 +146,7 @@ export const workflowRules = pgTable("workflow_rules", {
 
 // Workflow notifications table  
 export const workflowNotifications = pgTable("workflow_notifications", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   workflowId: varchar("workflow_id").notNull(),
   recipientId: varchar("recipient_id").notNull(),
   
@@ -165,7 +165,7 @@ export const workflowNotifications = pgTable("workflow_notifications", {
 
 // Two-factor authentication table
 export const twoFactorAuth = pgTable("two_factor_auth", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   userId: varchar("user_id").notNull().unique(),
   
   secret: varchar("secret").notNull(),
@@ -188,7 +188,7 @@ export const twoFactorAuth = pgTable("two_factor_auth", {
 
 // Two-factor sessions table
 export const twoFactorSessions = pgTable("two_factor_sessions", {
-  id: varchar("id").primaryKey(),
+  id: varchar("id").primaryKey().default(sql`gen_random_uuid()`),
   userId: varchar("user_id").notNull(),
   
   challengeCode: varchar("challenge_code").notNull(),
@@ -0,0 +1,112 @@
+import express from "express";
+import request from "supertest";
+import { beforeAll, beforeEach, describe, it, expect, vi } from "vitest";
+
+vi.mock("../../server/db", () => ({ db: {} }));
+
+const sampleUser = { id: "user-1", organizationId: "org-1" };
+// Request identity attached by the mocked auth middleware; never mutated
+const authenticatedUser = { claims: { sub: sampleUser.id } };
+
+vi.mock("../../server/replitAuth", () => ({
+  isAuthenticated: (req: any, _res: any, next: any) => {
+    req.user = authenticatedUser;
+    next();
+  },
+}));
+
+vi.mock("../../server/services/service-registry", () => ({
+  serviceRegistry: { getService: vi.fn() },
+}));
+
+const enhancedStorageStub = {
+  getUser: vi.fn(),
+  getIssuedCard: vi.fn(),
+  updateIssuedCard: vi.fn(),
+  getEnhancedTransaction: vi.fn(),
+  updateEnhancedTransaction: vi.fn(),
+  createAuditLog: vi.fn(),
+};
+
+vi.mock("../../server/enhanced-storage", () => ({
+  enhancedStorage: enhancedStorageStub,
+}));
+
+const app = express();
+
+beforeAll(async () => {
+  const { registerEnhancedRoutes } = await import("../../server/enhanced-routes");
+  app.use(express.json());
+  registerEnhancedRoutes(app);
+});
+
+beforeEach(() => {
+  vi.clearAllMocks();
+  enhancedStorageStub.getUser.mockResolvedValue(sampleUser);
+});
+
+describe("employee card routes", () => {
+  const ownCard = { id: "card-1", holderId: "user-1", organizationId: "org-1", lastFour: "4242" };
+
+  it.each<[string, string, object]>([
+    ["patch", "/api/employee/cards/card-2/freeze", {}],
+    ["post", "/api/employee/cards/card-2/pin", { pin: "1234" }],
+    ["post", "/api/employee/cards/card-2/report", { reason: "lost" }],
+  ])("%s %s rejects a card held by another user", async (method, path, body) => {
+    enhancedStorageStub.getIssuedCard.mockResolvedValue({ ...ownCard, id: "card-2", holderId: "user-2" });
+
+    const response = await (request(app) as any)[method](path).send(body);
+
+    expect(response.status).toBe(404);
+    expect(enhancedStorageStub.updateIssuedCard).not.toHaveBeenCalled();
+  });
+
+  it("rejects a card from another organization", async () => {
+    enhancedStorageStub.getIssuedCard.mockResolvedValue({ ...ownCard, organizationId: "org-2" });
+
+    const response = await request(app).patch("/api/employee/cards/card-1/freeze");
+
+    expect(response.status).toBe(404);
+    expect(enhancedStorageStub.updateIssuedCard).not.toHaveBeenCalled();
+  });
+
+  it("freezes the caller's own card", async () => {
+    enhancedStorageStub.getIssuedCard.mockResolvedValue(ownCard);
+
+    const response = await request(app).patch("/api/employee/cards/card-1/freeze");
+
+    expect(response.status).toBe(200);
+    expect(enhancedStorageStub.updateIssuedCard).toHaveBeenCalledWith(
+      "card-1",
+      expect.objectContaining({ status: "frozen", modifiedBy: "user-1" }),
+    );
+  });
+});
+
+describe("ACH transfer routes", () => {
+  const foreignTransfer = {
+    id: "txn-9",
+    organizationId: "org-2",
+    status: "pending_approval",
+    amount: "20000.00",
+    metadata: { recipientAccount: "123456789", approvalLevel: 1, approvals: [] },
+  };
+
+  it("hides another organization's transfer status", async () => {
+    enhancedStorageStub.getEnhancedTransaction.mockResolvedValue(foreignTransfer);
+
+    const response = await request(app).get("/api/ach/transfers/txn-9/status");
+
+    expect(response.status).toBe(404);
+    expect(response.body).not.toHaveProperty("metadata");
+  });
+
+  it("returns the status of the caller's own transfer", async () => {
+    enhancedStorageStub.getEnhancedTransaction.mockResolvedValue({ ...foreignTransfer, organizationId: "org-1" });
+
+    const response = await request(app).get("/api/ach/transfers/txn-9/status");
+
+    expect(response.status).toBe(200);
+    expect(response.body).toMatchObject({ id: "txn-9", status: "pending_approval" });
+  });
+});
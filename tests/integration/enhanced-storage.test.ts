@@ -1,164 +1,78 @@
-import { describe, it, expect, vi, afterEach } from "vitest";
-import type { Budget, Vendor, Payment, Expense, DigitalWallet } from "@shared/schema";
+import { describe, it, expect, vi, beforeAll, afterEach } from "vitest";
+import { PgDialect } from "drizzle-orm/pg-core";
+import type { SQL } from "drizzle-orm";
+import {
+  sampleBudgets,
+  sampleVendors,
+  samplePayments,
+  sampleExpenses,
+  sampleWallets,
+} from "./fixtures";
 
-vi.mock("../../server/db", () => ({ db: {} }));
+vi.mock("../../server/db", () => ({ db: {} as Record<string, unknown> }));
 
-const sampleBudgets: Budget[] = [
-  {
-    id: "budget-1",
-    name: "Operating Budget",
-    description: "Annual operations",
-    organizationId: "org-1",
-    fiscalYear: 2025,
-    totalAmount: "100000",
-    allocatedAmount: "80000",
-    spentAmount: "25000",
-    status: "active",
-    startDate: new Date().toISOString(),
-    endDate: new Date().toISOString(),
-    createdBy: "user-1",
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
-
-const sampleVendors: Vendor[] = [
-  {
-    id: "vendor-1",
-    name: "Acme Construction",
-    email: "info@acme.test",
-    phone: "555-1234",
-    address: "123 Main",
-    taxId: "99-9999999",
-    businessType: "construction",
-    status: "active",
-    organizationId: "org-1",
-    totalSpend: "40000",
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
-
-const samplePayments: Payment[] = [
-  {
-    id: "payment-1",
-    amount: "15000",
-    description: "Technology Services",
-    type: "vendor",
-    status: "pending",
-    vendorId: "vendor-1",
-    budgetCategoryId: null,
-    organizationId: "org-1",
-    dueDate: new Date().toISOString(),
-    processedDate: null,
-    createdBy: "user-1",
-    approvedBy: null,
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
-
-const sampleExpenses: Expense[] = [
-  {
-    id: "expense-1",
-    amount: "5000",
-    description: "Software Licenses",
-    status: "approved",
-    category: "Technology",
-    receiptUrl: null,
-    expenseDate: new Date().toISOString(),
-    submittedBy: "user-1",
-    approvedBy: null,
-    budgetCategoryId: null,
-    organizationId: "org-1",
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
-
-const sampleWallets: DigitalWallet[] = [
-  {
-    id: "wallet-1",
-    name: "General Fund",
-    type: "treasury",
-    balance: "500000",
-    accountNumber: null,
-    routingNumber: null,
-    isActive: true,
-    organizationId: "org-1",
-    externalAccountId: null,
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
+type ReadMethod = "getBudgets" | "getVendors" | "getPayments" | "getExpenses" | "getDigitalWallets";
 
 describe("EnhancedDatabaseStorage", () => {
-  afterEach(() => {
-    vi.restoreAllMocks();
+  // Load the storage modules once for the suite; each test only spies on the
+  // shared prototype and restoreAllMocks undoes that afterwards
+  let enhancedStorage: typeof import("../../server/enhanced-storage").enhancedStorage;
+  let DatabaseStorage: typeof import("../../server/storage").DatabaseStorage;
+
+  beforeAll(async () => {
+    ({ enhancedStorage } = await import("../../server/enhanced-storage"));
+    ({ DatabaseStorage } = await import("../../server/storage"));
   });
 
-  it("delegates budget retrieval to the base storage", async () => {
-    const { enhancedStorage } = await import("../../server/enhanced-storage");
-    const { DatabaseStorage } = await import("../../server/storage");
-
-    const spy = vi
-      .spyOn(DatabaseStorage.prototype, "getBudgets")
-      .mockResolvedValue(sampleBudgets);
-
-    const result = await enhancedStorage.getBudgets("org-1");
-    expect(spy).toHaveBeenCalledWith("org-1");
-    expect(result).toEqual(sampleBudgets);
-  });
-
-  it("delegates vendor retrieval to the base storage", async () => {
-    const { enhancedStorage } = await import("../../server/enhanced-storage");
-    const { DatabaseStorage } = await import("../../server/storage");
-
-    const spy = vi
-      .spyOn(DatabaseStorage.prototype, "getVendors")
-      .mockResolvedValue(sampleVendors);
-
-    const result = await enhancedStorage.getVendors("org-1");
-    expect(spy).toHaveBeenCalledWith("org-1");
-    expect(result).toEqual(sampleVendors);
-  });
-
-  it("delegates payment retrieval to the base storage", async () => {
-    const { enhancedStorage } = await import("../../server/enhanced-storage");
-    const { DatabaseStorage } = await import("../../server/storage");
-
-    const spy = vi
-      .spyOn(DatabaseStorage.prototype, "getPayments")
-      .mockResolvedValue(samplePayments);
-
-    const result = await enhancedStorage.getPayments("org-1");
-    expect(spy).toHaveBeenCalledWith("org-1");
-    expect(result).toEqual(samplePayments);
+  afterEach(() => {
+    vi.restoreAllMocks();
   });
 
-  it("delegates expense retrieval to the base storage", async () => {
-    const { enhancedStorage } = await import("../../server/enhanced-storage");
-    const { DatabaseStorage } = await import("../../server/storage");
-
+  it.each<[ReadMethod, unknown[]]>([
+    ["getBudgets", sampleBudgets],
+    ["getVendors", sampleVendors],
+    ["getPayments", samplePayments],
+    ["getExpenses", sampleExpenses],
+    ["getDigitalWallets", sampleWallets],
+  ])("delegates %s to the base storage", async (method, rows) => {
     const spy = vi
-      .spyOn(DatabaseStorage.prototype, "getExpenses")
-      .mockResolvedValue(sampleExpenses);
+      .spyOn(DatabaseStorage.prototype, method)
+      .mockResolvedValue(rows as any);
 
-    const result = await enhancedStorage.getExpenses("org-1");
+    const result = await enhancedStorage[method]("org-1");
     expect(spy).toHaveBeenCalledWith("org-1");
-    expect(result).toEqual(sampleExpenses);
+    expect(result).toEqual(rows);
   });
 
-  it("delegates wallet retrieval to the base storage", async () => {
-    const { enhancedStorage } = await import("../../server/enhanced-storage");
-    const { DatabaseStorage } = await import("../../server/storage");
-
-    const spy = vi
-      .spyOn(DatabaseStorage.prototype, "getDigitalWallets")
-      .mockResolvedValue(sampleWallets);
-
-    const result = await enhancedStorage.getDigitalWallets("org-1");
-    expect(spy).toHaveBeenCalledWith("org-1");
-    expect(result).toEqual(sampleWallets);
+  it("pages the audit trail on millisecond-truncated timestamps", async () => {
+    // Two rows written in the same millisecond differ only in microseconds;
+    // the cursor below is all a client can send back for the first of them
+    const { db } = (await import("../../server/db")) as unknown as { db: Record<string, unknown> };
+    const captured: { where?: SQL; orderBy?: SQL[] } = {};
+    const builder = {
+      from: () => builder,
+      where: (condition: SQL) => ((captured.where = condition), builder),
+      orderBy: (...columns: SQL[]) => ((captured.orderBy = columns), builder),
+      limit: async () => [],
+    };
+    db.select = () => builder;
+
+    await enhancedStorage.getAuditLogsByEntity("payment", "pay-1", 2, {
+      createdAt: new Date("2024-03-01T10:00:00.123Z"),
+      id: "log-b",
+    });
+
+    const dialect = new PgDialect();
+    const where = dialect.sqlToQuery(captured.where!);
+    const orderBy = captured.orderBy!.map((column) => dialect.sqlToQuery(column).sql);
+
+    // Both sides of the seek and the sort use the same precision, so the other
+    // row in that millisecond is ordered by id rather than skipped
+    expect(where.sql).toContain(`(date_trunc('milliseconds', "audit_logs"."created_at"), "audit_logs"."id") <`);
+    expect(where.params).toEqual(expect.arrayContaining(["2024-03-01T10:00:00.123Z", "log-b"]));
+    expect(orderBy).toEqual([
+      `date_trunc('milliseconds', "audit_logs"."created_at") desc`,
+      `"audit_logs"."id" desc`,
+    ]);
   });
 });
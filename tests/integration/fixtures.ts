@@ -0,0 +1,111 @@
+import type { Budget, Vendor, Payment, Expense, DigitalWallet } from "@shared/schema";
+
+// Rows shared by the integration suites. Tests only read these, so one copy
+// serves every suite instead of each file declaring its own.
+
+export const timestamp = new Date().toISOString();
+
+export const sampleBudgets: Budget[] = [
+  {
+    id: "budget-1",
+    name: "Operating Budget",
+    description: "Annual operations",
+    organizationId: "org-1",
+    fiscalYear: 2025,
+    totalAmount: "100000",
+    allocatedAmount: "80000",
+    spentAmount: "25000",
+    status: "active",
+    startDate: timestamp,
+    endDate: timestamp,
+    createdBy: "user-1",
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+];
+
+export const sampleVendors: Vendor[] = [
+  {
+    id: "vendor-1",
+    name: "Acme Construction",
+    email: "info@acme.test",
+    phone: "555-1234",
+    address: "123 Main",
+    taxId: "99-9999999",
+    businessType: "construction",
+    status: "active",
+    organizationId: "org-1",
+    totalSpend: "40000",
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+];
+
+export const samplePayments: Payment[] = [
+  {
+    id: "payment-1",
+    amount: "15000",
+    description: "Technology Services",
+    type: "vendor",
+    status: "pending",
+    vendorId: "vendor-1",
+    budgetCategoryId: null,
+    organizationId: "org-1",
+    dueDate: timestamp,
+    processedDate: null,
+    createdBy: "user-1",
+    approvedBy: null,
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+  {
+    id: "payment-2",
+    amount: "5000",
+    description: "Maintenance",
+    type: "vendor",
+    status: "completed",
+    vendorId: "vendor-1",
+    budgetCategoryId: null,
+    organizationId: "org-1",
+    dueDate: timestamp,
+    processedDate: timestamp,
+    createdBy: "user-1",
+    approvedBy: "user-1",
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+];
+
+export const sampleExpenses: Expense[] = [
+  {
+    id: "expense-1",
+    amount: "5000",
+    description: "Software Licenses",
+    status: "approved",
+    category: "Technology",
+    receiptUrl: null,
+    expenseDate: timestamp,
+    submittedBy: "user-1",
+    approvedBy: null,
+    budgetCategoryId: null,
+    organizationId: "org-1",
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+];
+
+export const sampleWallets: DigitalWallet[] = [
+  {
+    id: "wallet-1",
+    name: "General Fund",
+    type: "treasury",
+    balance: "500000",
+    accountNumber: null,
+    routingNumber: null,
+    isActive: true,
+    organizationId: "org-1",
+    externalAccountId: null,
+    createdAt: timestamp,
+    updatedAt: timestamp,
+  },
+];
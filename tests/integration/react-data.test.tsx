@@ -2,48 +2,12 @@ import "@testing-library/jest-dom/vitest";
 import { afterEach, beforeAll, afterAll, describe, expect, it } from "vitest";
 import { render, screen, cleanup } from "@testing-library/react";
 import { QueryClient, QueryClientProvider } from "@tanstack/react-query";
-import type { Budget, Payment } from "@shared/schema";
 import React, { type ReactElement } from "react";
 import BudgetOverview from "@/components/dashboard/budget-overview";
 import PendingPayments from "@/components/dashboard/pending-payments";
+import { sampleBudgets, samplePayments } from "./fixtures";
 
-const sampleBudgets: Budget[] = [
-  {
-    id: "budget-1",
-    name: "Operating Budget",
-    description: "Annual operations",
-    organizationId: "org-1",
-    fiscalYear: 2025,
-    totalAmount: "100000",
-    allocatedAmount: "80000",
-    spentAmount: "25000",
-    status: "active",
-    startDate: new Date().toISOString(),
-    endDate: new Date().toISOString(),
-    createdBy: "user-1",
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
-
-const samplePayments: Payment[] = [
-  {
-    id: "payment-1",
-    amount: "15000",
-    description: "Technology Services",
-    type: "vendor",
-    status: "pending",
-    vendorId: "vendor-1",
-    budgetCategoryId: null,
-    organizationId: "org-1",
-    dueDate: new Date().toISOString(),
-    processedDate: null,
-    createdBy: "user-1",
-    approvedBy: null,
-    createdAt: new Date().toISOString(),
-    updatedAt: new Date().toISOString(),
-  },
-];
+const pendingPayments = samplePayments.filter((payment) => payment.status === "pending");
 
 let originalFetch: typeof fetch;
 
@@ -59,7 +23,7 @@ beforeAll(() => {
       });
     }
     if (url.includes("/api/payments/pending")) {
-      return new Response(JSON.stringify(samplePayments), {
+      return new Response(JSON.stringify(pendingPayments), {
         status: 200,
         headers: { "Content-Type": "application/json" },
       });